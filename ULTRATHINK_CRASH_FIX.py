@@ -5,8 +5,15 @@ ULTRATHINKING: Railway Deployment Crash Analysis & Fix
 import subprocess
 import json
 import time
+import random
 from datetime import datetime
 
+# Polling a redeploy: seconds before the first check, the longest gap between
+# checks, and how long to keep checking
+POLL_FIRST_DELAY = 2
+POLL_MAX_DELAY = 60
+POLL_DEADLINE = 180
+
 def run_command(cmd):
     """Execute command and return output"""
     try:
@@ -135,9 +142,15 @@ def redeploy():
         print(stdout)
         
         print("\n⏳ Waiting for deployment to complete...")
-        for i in range(6):  # Wait up to 3 minutes
-            time.sleep(30)
-            print(f"   Checking... ({i+1}/6)")
+        # Poll soon at first, since a fresh deploy is often up within a minute,
+        # then back off with jitter; give up after 3 minutes as before
+        deadline = time.monotonic() + POLL_DEADLINE
+        attempt = 0
+        while time.monotonic() < deadline:
+            delay = min(POLL_MAX_DELAY, POLL_FIRST_DELAY * 1.5 ** attempt) + random.uniform(0, 1)
+            time.sleep(max(0, min(delay, deadline - time.monotonic())))
+            attempt += 1
+            print(f"   Checking... ({attempt})")
             
             # Test if deployment is live
             stdout, _ = run_command("curl -s https://metaads-python-api-production.up.railway.app")
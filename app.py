@@ -126,7 +126,8 @@ def health_check():
             "has_openai_key": bool(os.getenv("OPENAI_API_KEY")),
             "openai_key_valid": os.getenv("OPENAI_API_KEY") != "sk-demo-key-replace-with-real-api-key" if os.getenv("OPENAI_API_KEY") else False,
             "cors_enabled": True,
-            "railway_region": os.getenv("RAILWAY_ENVIRONMENT", "unknown")
+            "railway_region": os.getenv("RAILWAY_ENVIRONMENT", "unknown"),
+            "build_id": os.getenv("RAILWAY_DEPLOYMENT_ID") or os.getenv("RAILWAY_GIT_COMMIT_SHA")
         }
     })
 
@@ -11,7 +11,7 @@ import os
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from agents.workflow import process_campaign_request
+from agents.workflow import process_campaign_request, stream_campaign_request, progress_update
 
 
 async def main():
@@ -25,6 +25,9 @@ async def main():
     
     # Parse arguments
     args = sys.argv[1:]
+    stream = "--stream" in args
+    if stream:
+        args = [arg for arg in args if arg != "--stream"]
     for i in range(0, len(args), 2):
         if args[i] == "--message" and i + 1 < len(args):
             message = args[i + 1]
@@ -73,7 +76,15 @@ async def main():
     try:
         # Process through workflow
         start_time = datetime.now()
-        result = await process_campaign_request(message, user_id)
+        if stream:
+            # Emit one NDJSON line per agent so the caller can render progress
+            result = {}
+            async for agent_name, agent_state in stream_campaign_request(message, user_id):
+                result = agent_state
+                if agent_name != "supervisor":
+                    print(json.dumps({"type": "progress", **progress_update(agent_name, agent_state)}), flush=True)
+        else:
+            result = await process_campaign_request(message, user_id)
         execution_time = (datetime.now() - start_time).total_seconds()
         
         # Format response for frontend
@@ -98,6 +109,8 @@ async def main():
             "warnings": result.get("warnings", [])
         }
         
+        if stream:
+            response = {"type": "result", **response}
         print(json.dumps(response))
         
     except Exception as e:
@@ -2,7 +2,6 @@
 Campaign State Definition for LangGraph
 """
 from typing import TypedDict, List, Dict, Any, Optional, Literal
-from datetime import datetime
 
 
 class CampaignState(TypedDict):
@@ -12,7 +11,7 @@ class CampaignState(TypedDict):
     user_request: str
     user_id: Optional[str]
     session_id: str
-    timestamp: datetime
+    timestamp: int  # Request start, nanoseconds since the epoch (time.time_ns)
     
     # Parsed Campaign Information
     campaign_objective: Optional[Literal[
@@ -7,8 +7,20 @@ from typing import Dict, Any, Optional
 from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # Fall back to stdlib json when orjson isn't installed
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Load environment variables (skip the .env read when the key is already set)
+if "OPENAI_API_KEY" not in os.environ:
+    load_dotenv()
 
 # Initialize OpenAI client only if API key is available
 api_key = os.getenv("OPENAI_API_KEY")
@@ -51,7 +63,7 @@ Be intelligent about inferring details. For example:
 
     user_prompt = f"""Parse this campaign request: "{user_request}"
 
-Hints from initial parsing: {json.dumps(quick_parse_hints or {})}
+Hints from initial parsing: {_dumps(quick_parse_hints or {})}
 
 Return only valid JSON."""
 
@@ -69,7 +81,7 @@ Return only valid JSON."""
             response_format={"type": "json_object"}
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = _loads(response.choices[0].message.content)
         return result
         
     except Exception as e:
@@ -143,7 +155,7 @@ Return only valid JSON."""
             response_format={"type": "json_object"}
         )
         
-        return json.loads(response.choices[0].message.content)
+        return _loads(response.choices[0].message.content)
         
     except Exception as e:
         # Fallback creative
@@ -168,7 +180,7 @@ async def optimize_campaign_parameters(
     prompt = f"""As a marketing expert, provide optimization recommendations for:
 - Objective: {objective}
 - Budget: ${budget}/day for {duration_days} days
-- Audience: {json.dumps(target_audience)}
+- Audience: {_dumps(target_audience)}
 
 Suggest:
 1. Optimal budget allocation
@@ -189,7 +201,7 @@ Return as JSON with: recommendations, expected_results, warnings"""
             response_format={"type": "json_object"}
         )
         
-        return json.loads(response.choices[0].message.content)
+        return _loads(response.choices[0].message.content)
         
     except Exception:
         # Fallback recommendations
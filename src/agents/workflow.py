@@ -1,10 +1,10 @@
 """
 LangGraph Workflow for Campaign Creation
 """
-from typing import Dict, Any, Literal
-from datetime import datetime
+from typing import Dict, Any, Literal, AsyncIterator, Tuple
 from langgraph.graph import StateGraph, END
-import uuid
+import secrets
+import time
 
 from .state import CampaignState
 from .supervisor import SupervisorAgent
@@ -32,6 +32,39 @@ def route_supervisor(state: Dict[str, Any]) -> Literal["parser", "creative", "bu
     return next_agent
 
 
+def _can_skip_supervisor(state: Dict[str, Any]) -> bool:
+    """
+    True when the last agent finished cleanly and the supervisor has nothing to recover
+    """
+    return state.get("processing_status") != "error" and len(state.get("errors") or []) <= 2
+
+
+def route_after_parser(state: Dict[str, Any]) -> Literal["creative", "supervisor"]:
+    """
+    Go straight to creative once the request is parsed; otherwise let the supervisor decide
+    """
+    has_parsed_data = all([
+        state.get("campaign_objective"),
+        state.get("budget") is not None,
+        state.get("target_audience")
+    ])
+    
+    if has_parsed_data and _can_skip_supervisor(state):
+        return "creative"
+    
+    return "supervisor"
+
+
+def route_after_creative(state: Dict[str, Any]) -> Literal["builder", "supervisor"]:
+    """
+    Go straight to builder once creative exists; otherwise let the supervisor decide
+    """
+    if state.get("ad_creative") and _can_skip_supervisor(state):
+        return "builder"
+    
+    return "supervisor"
+
+
 async def initialize_state(user_request: str, user_id: str = None) -> CampaignState:
     """
     Initialize the state for a new campaign request
@@ -39,8 +72,8 @@ async def initialize_state(user_request: str, user_id: str = None) -> CampaignSt
     return {
         "user_request": user_request,
         "user_id": user_id,
-        "session_id": str(uuid.uuid4()),
-        "timestamp": datetime.now(),
+        "session_id": secrets.token_hex(8),
+        "timestamp": time.time_ns(),
         "processing_status": "initializing",
         "messages": [],
         "errors": [],
@@ -79,9 +112,26 @@ def create_campaign_workflow() -> StateGraph:
         }
     )
     
-    # All other agents return to supervisor
-    workflow.add_edge("parser", "supervisor")
-    workflow.add_edge("creative", "supervisor")
+    # Workers hand off directly on success and only fall back to the
+    # supervisor when something went wrong
+    workflow.add_conditional_edges(
+        "parser",
+        route_after_parser,
+        {
+            "creative": "creative",
+            "supervisor": "supervisor"
+        }
+    )
+    workflow.add_conditional_edges(
+        "creative",
+        route_after_creative,
+        {
+            "builder": "builder",
+            "supervisor": "supervisor"
+        }
+    )
+    
+    # Builder returns to supervisor, which finalizes the campaign
     workflow.add_edge("builder", "supervisor")
     
     return workflow
@@ -92,43 +142,67 @@ campaign_workflow = create_campaign_workflow()
 app = campaign_workflow.compile()
 
 
-async def process_campaign_request(
+async def stream_campaign_request(
     user_request: str,
-    user_id: str = None,
-    stream_callback = None
-) -> Dict[str, Any]:
+    user_id: str = None
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
     """
-    Process a campaign request through the workflow
+    Stream a campaign request through the workflow
     
     Args:
         user_request: Natural language campaign request
         user_id: Optional user identifier
-        stream_callback: Optional async callback for streaming updates
     
-    Returns:
-        Final state with campaign plan
+    Yields:
+        (agent_name, agent_state) for each agent as soon as it finishes
     """
     # Initialize state
     initial_state = await initialize_state(user_request, user_id)
     
-    # Process through workflow
-    final_state = initial_state
     async for output in app.astream(initial_state):
         # Get the agent that just ran
         agent_name = list(output.keys())[0] if output else "unknown"
         agent_state = list(output.values())[0] if output else {}
         
+        yield agent_name, agent_state
+
+
+def progress_update(agent_name: str, agent_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the progress update sent to callers for a finished agent
+    """
+    return {
+        "agent": agent_name,
+        "status": agent_state.get("processing_status"),
+        "message": agent_state.get("messages", [])[-1] if agent_state.get("messages") else None,
+        "progress": _calculate_progress(agent_state)
+    }
+
+
+async def process_campaign_request(
+    user_request: str,
+    user_id: str = None,
+    stream_callback = None
+) -> Dict[str, Any]:
+    """
+    Process a campaign request through the workflow
+    
+    Args:
+        user_request: Natural language campaign request
+        user_id: Optional user identifier
+        stream_callback: Optional async callback for streaming updates
+    
+    Returns:
+        Final state with campaign plan
+    """
+    final_state = {}
+    async for agent_name, agent_state in stream_campaign_request(user_request, user_id):
         # Update final state
         final_state = agent_state
         
         # Stream update if callback provided
         if stream_callback and agent_name != "supervisor":
-            await stream_callback({
-                "agent": agent_name,
-                "status": agent_state.get("processing_status"),
-                "message": agent_state.get("messages", [])[-1] if agent_state.get("messages") else None,
-                "progress": _calculate_progress(agent_state)
-            })
+            await stream_callback(progress_update(agent_name, agent_state))
     
     return final_state
 
@@ -174,4 +248,11 @@ if __name__ == "__main__":
         print(f"Errors: {result.get('errors')}")
         print(f"Messages: {len(result.get('messages', []))}")
     
+    # uvloop is an optional, faster drop-in for the default event loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(test_workflow())
\ No newline at end of file
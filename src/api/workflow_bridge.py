@@ -5,16 +5,28 @@ Workflow Bridge - Connects Next.js API to our Python agents
 CEO Note: This is the bridge between worlds. Keep it simple and fast.
 """
 
+import os
 import sys
 import json
 import asyncio
 import argparse
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson isn't installed
+    orjson = None
 
 # Add project root to path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 
-from workflows.complete_campaign_workflow import create_campaign_magic
+def emit_json(payload):
+    """Write a JSON payload to stdout as a single line"""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(payload) + b"\n")
+        sys.stdout.flush()
+    else:
+        print(json.dumps(payload))
 
 
 async def main():
@@ -24,6 +36,9 @@ async def main():
     args = parser.parse_args()
     
     try:
+        # Imported here so --help and argument errors skip loading langgraph/openai
+        from workflows.complete_campaign_workflow import create_campaign_magic
+        
         # Execute workflow
         result = await create_campaign_magic(
             user_request=args.message,
@@ -54,7 +69,7 @@ async def main():
         }
         
         # Output JSON to stdout
-        print(json.dumps(output))
+        emit_json(output)
         
     except Exception as e:
         error_output = {
@@ -63,9 +78,16 @@ async def main():
             "campaign": None,
             "content": []
         }
-        print(json.dumps(error_output))
+        emit_json(error_output)
         sys.exit(1)
 
 
 if __name__ == "__main__":
+    # uvloop is an optional, faster drop-in for the default event loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
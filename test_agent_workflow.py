@@ -13,6 +13,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from agents.workflow import process_campaign_request
 
+# Max campaign requests in flight at once (each runs a chain of GPT-4 calls)
+MAX_CONCURRENT_REQUESTS = 3
+
 
 async def test_workflow():
     """Test the complete AI workflow"""
@@ -51,22 +54,19 @@ async def test_workflow():
         
         return
     
-    # Process each test request
-    for test in test_requests:
-        print(f"📝 Testing: {test['name']}")
-        print(f"   Request: \"{test['request']}\"\n")
+    # Process all test requests concurrently; the semaphore keeps us under OpenAI rate limits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def run_test(test):
+        """Process one test request, collecting its progress updates"""
+        progress_messages = []
         
-        try:
-            # Track progress
-            progress_messages = []
-            
-            async def progress_callback(update):
-                """Callback to show progress"""
-                if update.get("message"):
-                    progress_messages.append(update["message"])
-                    print(f"   → {update['agent']}: {update['message']['content'][:100]}...")
-            
-            # Process the request
+        async def progress_callback(update):
+            """Callback to collect progress"""
+            if update.get("message"):
+                progress_messages.append((update["agent"], update["message"]))
+        
+        async with semaphore:
             start_time = datetime.now()
             result = await process_campaign_request(
                 test["request"],
@@ -74,37 +74,54 @@ async def test_workflow():
                 stream_callback=progress_callback
             )
             execution_time = (datetime.now() - start_time).total_seconds()
+        
+        return result, execution_time, progress_messages
+    
+    outcomes = await asyncio.gather(
+        *(run_test(test) for test in test_requests),
+        return_exceptions=True
+    )
+    
+    # Display results in request order
+    for test, outcome in zip(test_requests, outcomes):
+        print(f"📝 Testing: {test['name']}")
+        print(f"   Request: \"{test['request']}\"\n")
+        
+        if isinstance(outcome, BaseException):
+            print(f"   ❌ Error: {str(outcome)}\n")
+            import traceback
+            traceback.print_exception(type(outcome), outcome, outcome.__traceback__)
+            continue
+        
+        result, execution_time, progress_messages = outcome
+        for agent, message in progress_messages:
+            print(f"   → {agent}: {message['content'][:100]}...")
+        
+        # Display results
+        print(f"\n   ✅ Completed in {execution_time:.2f} seconds")
+        
+        if result.get("campaign_objective"):
+            print(f"   📊 Campaign Details:")
+            print(f"      - Objective: {result.get('campaign_objective')}")
+            print(f"      - Budget: ${result.get('budget')} {result.get('budget_type', 'daily')}")
+            print(f"      - Duration: {result.get('duration_days', 30)} days")
             
-            # Display results
-            print(f"\n   ✅ Completed in {execution_time:.2f} seconds")
-            
-            if result.get("campaign_objective"):
-                print(f"   📊 Campaign Details:")
-                print(f"      - Objective: {result.get('campaign_objective')}")
-                print(f"      - Budget: ${result.get('budget')} {result.get('budget_type', 'daily')}")
-                print(f"      - Duration: {result.get('duration_days', 30)} days")
-                
-                if result.get("target_audience"):
-                    audience = result["target_audience"]
-                    print(f"      - Target: Ages {audience.get('age_min')}-{audience.get('age_max')}")
-                    if audience.get("interests"):
-                        print(f"      - Interests: {', '.join(audience['interests'][:3])}")
-                
-                if result.get("ad_creative"):
-                    creative = result["ad_creative"]
-                    print(f"\n   🎨 Ad Creative:")
-                    print(f"      Headline: \"{creative.get('headline')}\"")
-                    print(f"      CTA: {creative.get('cta')}")
-            
-            if result.get("errors"):
-                print(f"\n   ⚠️  Errors: {', '.join(result['errors'])}")
-            
-            print("\n" + "="*60 + "\n")
+            if result.get("target_audience"):
+                audience = result["target_audience"]
+                print(f"      - Target: Ages {audience.get('age_min')}-{audience.get('age_max')}")
+                if audience.get("interests"):
+                    print(f"      - Interests: {', '.join(audience['interests'][:3])}")
             
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}\n")
-            import traceback
-            traceback.print_exc()
+            if result.get("ad_creative"):
+                creative = result["ad_creative"]
+                print(f"\n   🎨 Ad Creative:")
+                print(f"      Headline: \"{creative.get('headline')}\"")
+                print(f"      CTA: {creative.get('cta')}")
+        
+        if result.get("errors"):
+            print(f"\n   ⚠️  Errors: {', '.join(result['errors'])}")
+        
+        print("\n" + "="*60 + "\n")
 
 
 async def test_api_bridge():
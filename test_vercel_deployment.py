@@ -2,62 +2,108 @@
 """
 Test the Vercel deployment of Python AI agents
 """
-import requests
+import aiohttp
+import asyncio
 import json
 import time
 
-def test_vercel_deployment():
+
+async def wait_ready(session, url, deadline=30):
+    """Poll url with HEAD until it answers below 500, backing off up to the deadline.
+
+    Returns the last status code seen, or None if nothing answered.
+    """
+    status = None
+    give_up_at = time.monotonic() + deadline
+    attempt = 0
+
+    while True:
+        try:
+            async with session.head(url, timeout=aiohttp.ClientTimeout(total=2), allow_redirects=True) as response:
+                status = response.status
+                if status < 500:
+                    return status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+        remaining = give_up_at - time.monotonic()
+        if remaining <= 0:
+            return status
+        await asyncio.sleep(min(2 ** attempt, 4, remaining))
+        attempt += 1
+
+
+async def test_url(session, base_url):
+    """Test one deployment URL, returning the report lines to print"""
+    lines = [f"\n📍 Testing {base_url}"]
+
+    try:
+        # Poll until the deployment answers instead of sleeping a fixed time
+        status = await wait_ready(session, base_url, deadline=30)
+        if status is None or status >= 500:
+            lines.append(f"   ⏱️  Site not ready (Status: {status})")
+            return lines
+        lines.append(f"   ✅ Site is up (Status: {status})")
+
+        # Test the API endpoint
+        api_url = f"{base_url}/api/campaign/create"
+        test_data = {
+            "message": "Create a campaign for my fitness app targeting millennials in NYC with $100/day budget",
+            "userId": "test_vercel"
+        }
+
+        lines.append(f"   🔄 Testing API at {api_url}")
+        async with session.post(
+            api_url,
+            json=test_data,
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as api_response:
+            if api_response.status == 200:
+                data = await api_response.json(content_type=None)
+                lines.append(f"   ✅ API working! Response: {data.get('message', 'Success')}")
+                if data.get('campaign'):
+                    lines.append(f"   📊 Campaign: {data['campaign'].get('name', 'Unknown')}")
+                    lines.append(f"   💰 Budget: {data['campaign'].get('budget', 'Unknown')}")
+            else:
+                text = await api_response.text()
+                lines.append(f"   ❌ API returned {api_response.status}")
+                lines.append(f"   Response: {text[:200]}")
+
+    except asyncio.TimeoutError:
+        lines.append(f"   ⏱️  Request timed out")
+    except Exception as e:
+        lines.append(f"   ❌ Error: {str(e)}")
+
+    return lines
+
+
+async def test_vercel_deployment():
     """Test the deployed Python endpoint"""
     print("🚀 Testing Vercel Python Deployment\n")
-    
-    # Wait for deployment to complete
-    print("⏳ Waiting 30 seconds for Vercel deployment...")
-    time.sleep(30)
-    
+
+    print("⏳ Waiting for Vercel deployment (up to 30 seconds)...")
+
     # Test URLs
     urls = [
         "https://metaads-peach.vercel.app",
         "https://metaads.vercel.app"
     ]
-    
-    for base_url in urls:
-        print(f"\n📍 Testing {base_url}")
-        
-        try:
-            # Test if site is up
-            response = requests.get(base_url, timeout=10)
-            print(f"   ✅ Site is up (Status: {response.status_code})")
-            
-            # Test the API endpoint
-            api_url = f"{base_url}/api/campaign/create"
-            test_data = {
-                "message": "Create a campaign for my fitness app targeting millennials in NYC with $100/day budget",
-                "userId": "test_vercel"
-            }
-            
-            print(f"   🔄 Testing API at {api_url}")
-            api_response = requests.post(
-                api_url,
-                json=test_data,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
-            
-            if api_response.status_code == 200:
-                data = api_response.json()
-                print(f"   ✅ API working! Response: {data.get('message', 'Success')}")
-                if data.get('campaign'):
-                    print(f"   📊 Campaign: {data['campaign'].get('name', 'Unknown')}")
-                    print(f"   💰 Budget: {data['campaign'].get('budget', 'Unknown')}")
-            else:
-                print(f"   ❌ API returned {api_response.status_code}")
-                print(f"   Response: {api_response.text[:200]}")
-                
-        except requests.exceptions.Timeout:
-            print(f"   ⏱️  Request timed out")
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-    
+
+    # One session for all URLs so connections are pooled; URLs are tested concurrently.
+    # The HEAD polls, GET and POST to each host reuse up to 4 kept-alive connections.
+    connector = aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30)) as session:
+        results = await asyncio.gather(
+            *(test_url(session, base_url) for base_url in urls),
+            return_exceptions=True
+        )
+
+    for base_url, lines in zip(urls, results):
+        if isinstance(lines, BaseException):
+            lines = [f"\n📍 Testing {base_url}", f"   ❌ Error: {str(lines)}"]
+        print("\n".join(lines))
+
     print("\n" + "="*50)
     print("💡 Next steps:")
     print("1. Check Vercel dashboard for build logs")
@@ -66,4 +112,4 @@ def test_vercel_deployment():
     print("="*50 + "\n")
 
 if __name__ == "__main__":
-    test_vercel_deployment()
\ No newline at end of file
+    asyncio.run(test_vercel_deployment())
@@ -4,7 +4,10 @@ ULTRATHINKING DEPLOYMENT via Railway API
 Direct deployment without CLI
 """
 import json
+import os
 import subprocess
+import sys
+import threading
 import time
 import webbrowser
 from datetime import datetime
@@ -22,6 +25,14 @@ def create_deployment_url():
     }
     return base_url
 
+def can_open_browser():
+    """Whether there is an interactive desktop session to open a browser in"""
+    if os.environ.get("CI") or not sys.stdout.isatty():
+        return False
+    if sys.platform in ("darwin", "win32"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
 def open_railway_deployment():
     """Open Railway deployment page in browser"""
     print("🧠 ULTRATHINKING RAILWAY DEPLOYMENT")
@@ -31,25 +42,40 @@ def open_railway_deployment():
     
     url = "https://railway.app/new/github/palinopr/metaads"
     
-    try:
-        # Try to open in default browser
-        webbrowser.open(url)
-        print("✅ Opened deployment page in browser!")
-        print("")
-        print("📋 MANUAL STEPS:")
-        print("1. Select your GitHub repo: palinopr/metaads")
-        print("2. Name the service: metaads-python-api")
-        print("3. Click 'Deploy'")
-        print("4. Wait 2-3 minutes")
-        print("")
-        print("🔗 Direct link if browser didn't open:")
-        print(f"   {url}")
+    if not can_open_browser():
+        print("🖥️  No desktop session detected, not opening a browser")
+    else:
+        # Try to open in default browser; some launchers (xdg-open) block while
+        # the browser starts, so don't wait on them for more than 2 seconds
+        outcome = {}
+        
+        def _open():
+            try:
+                outcome["opened"] = webbrowser.open(url)
+            except Exception as e:
+                outcome["error"] = e
         
-    except Exception as e:
-        print(f"❌ Couldn't open browser: {e}")
-        print("")
-        print("🔗 Open this URL manually:")
-        print(f"   {url}")
+        opener = threading.Thread(target=_open, daemon=True)
+        opener.start()
+        opener.join(2)
+        if "error" in outcome:
+            print(f"❌ Couldn't open browser: {outcome['error']}")
+        elif opener.is_alive():
+            print("⏳ Browser is still starting...")
+        elif outcome.get("opened"):
+            print("✅ Opened deployment page in browser!")
+        else:
+            print("❌ Couldn't open browser")
+    
+    print("")
+    print("📋 MANUAL STEPS:")
+    print("1. Select your GitHub repo: palinopr/metaads")
+    print("2. Name the service: metaads-python-api")
+    print("3. Click 'Deploy'")
+    print("4. Wait 2-3 minutes")
+    print("")
+    print("🔗 Open this URL manually if the browser didn't:")
+    print(f"   {url}")
 
 def create_curl_deployment():
     """Create a curl command for deployment"""
@@ -6,14 +6,83 @@ Automated deployment checklist with validation and fixes.
 """
 
 import os
+import re
 import sys
 import json
+import multiprocessing
+from bisect import bisect_right
+import signal
 import subprocess
 import shutil
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+# CLI probes shared by several checks, run together in a single shell
+PROBE_COMMANDS = {
+    "node": ["node", "--version"],
+    "npm": ["npm", "--version"],
+    "git": ["git", "--version"],
+    "railway_whoami": ["railway", "whoami"],
+    "railway_status": ["railway", "status"],
+}
+PROBE_MARKER = "@@ultrathink-probe@@"
+PROBE_TIMEOUT = 3  # seconds per probe; a hung CLI must not stall the checklist
+
+# OpenAI API keys, GitHub tokens and hardcoded passwords, in one pass.
+# Files are scanned concatenated, so no pattern may match across a NUL separator.
+SECRET_PATTERN = re.compile(
+    rb"sk-[a-zA-Z0-9]{48}"
+    rb"|ghp_[a-zA-Z0-9]{36}"
+    rb"|password\s*=\s*[\"'][^\"'\x00]+[\"']"
+)
+FILE_SEPARATOR = b"\n\x00\n"
+SCAN_BATCH_BYTES = 64 * 1024 * 1024
+SCAN_SKIP_DIRS = {"venv", ".venv", "node_modules", ".git", "__pycache__", "dist", "build"}
+
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_COMPILE_MIN_FILES = 32
+
+# Files that compiled cleanly, keyed by absolute path -> [mtime_ns, size].
+# On by default; under CI it is skipped unless METAADS_SYNTAX_CACHE=1.
+SYNTAX_CACHE_FILE = Path.home() / ".cache" / "metaads" / "syntax_cache.json"
+
+
+def _iter_python_files(root: str = "."):
+    """Yield .py files under root, pruning SCAN_SKIP_DIRS before descending"""
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SCAN_SKIP_DIRS]
+        for name in files:
+            if name.endswith(".py"):
+                yield Path(dirpath) / name
+
+
+def _syntax_cache_enabled() -> bool:
+    """Whether the syntax check may reuse results from earlier runs"""
+    setting = os.environ.get("METAADS_SYNTAX_CACHE")
+    if setting is not None:
+        return setting.lower() not in ("", "0", "false", "no")
+    return not os.environ.get("CI")
+
+
+def _compile_one(py_file: Path) -> Tuple[Path, Optional[str]]:
+    """Compile one Python file; returns (path, error message or None)"""
+    try:
+        # Bytes go straight to the tokenizer, which honours PEP 263 coding cookies
+        with open(py_file, 'rb') as f:
+            compile(f.read(), str(py_file), 'exec')
+    except (SyntaxError, ValueError) as e:
+        return py_file, str(e)
+    return py_file, None
+
+
+
 class DeploymentChecklist:
     """Comprehensive deployment checklist"""
     
@@ -24,12 +93,23 @@ class DeploymentChecklist:
             "passed": 0,
             "failed": 0,
             "warnings": 0,
+            "skipped": 0,
             "details": []
         }
+        self._file_cache: Dict[str, Optional[bytes]] = {}
+        self._pkgjson = None
+        self._procfile = None
+        # Resolved once; several checks and the probes all need these
+        self._paths = {name: shutil.which(name) for name in ("node", "npm", "git", "railway")}
+        self._probe_cache = self._run_probes()
         self._setup_checks()
         
     def _setup_checks(self):
-        """Configure all deployment checks"""
+        """Configure all deployment checks
+
+        Entries are (name, func, severity) with an optional fourth element
+        listing checks that must pass (or warn) before this one runs.
+        """
         self.checks = [
             # Environment checks
             ("Python version", self._check_python_version, "critical"),
@@ -51,7 +131,7 @@ class DeploymentChecklist:
             # Code quality
             ("No syntax errors", self._check_syntax_errors, "critical"),
             ("Environment variables", self._check_env_vars, "important"),
-            ("Port configuration", self._check_port_config, "critical"),
+            ("Port configuration", self._check_port_config, "critical", ("Backend files present",)),
             
             # Build readiness
             ("Node modules installed", self._check_node_modules, "warning"),
@@ -65,7 +145,7 @@ class DeploymentChecklist:
             # Deployment specific
             ("Procfile valid", self._check_procfile, "critical"),
             ("Runtime specified", self._check_runtime, "important"),
-            ("Start command works", self._check_start_command, "critical"),
+            ("Start command works", self._check_start_command, "critical", ("Procfile valid",)),
         ]
         
     def run_checklist(self) -> Dict:
@@ -75,40 +155,49 @@ class DeploymentChecklist:
         print("=" * 60)
         print()
         
-        for check_name, check_func, severity in self.checks:
-            print(f"Checking: {check_name}... ", end="", flush=True)
-            
-            try:
-                result = check_func()
-                
-                if result["status"] == "pass":
-                    print("✅ PASS")
-                    self.results["passed"] += 1
-                elif result["status"] == "warning":
-                    print("⚠️  WARNING")
-                    self.results["warnings"] += 1
-                else:
-                    print("❌ FAIL")
-                    self.results["failed"] += 1
+        # Checks run concurrently to overlap the subprocess and file I/O; a check
+        # only starts once its dependencies finish, and is skipped if one failed.
+        # Results are collected on this thread only.
+        details = [None] * len(self.checks)
+        labels = [None] * len(self.checks)
+        depends_on = [check[3] if len(check) > 3 else () for check in self.checks]
+        finished = {}
+        waiting = list(range(len(self.checks)))
+        futures = {}
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            while waiting or futures:
+                progressed = False
+                for index in list(waiting):
+                    if not all(dep in finished for dep in depends_on[index]):
+                        continue
+                        
+                    waiting.remove(index)
+                    progressed = True
+                    blocked = [dep for dep in depends_on[index] if finished[dep] not in ("pass", "warning")]
+                    if blocked:
+                        finished[self.checks[index][0]] = self._record_result(
+                            details, labels, index, skipped_by=blocked
+                        )
+                    else:
+                        futures[executor.submit(self.checks[index][1])] = index
+                        
+                if not futures:
+                    if not progressed:
+                        raise ValueError("Checklist has unknown or circular dependencies")
+                    continue
                     
-                self.results["details"].append({
-                    "check": check_name,
-                    "severity": severity,
-                    "status": result["status"],
-                    "message": result.get("message", ""),
-                    "fix": result.get("fix", "")
-                })
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures.pop(future)
+                    finished[self.checks[index][0]] = self._record_result(
+                        details, labels, index, future=future
+                    )
                 
-            except Exception as e:
-                print("❌ ERROR")
-                self.results["failed"] += 1
-                self.results["details"].append({
-                    "check": check_name,
-                    "severity": severity,
-                    "status": "error",
-                    "message": str(e),
-                    "fix": "Check implementation"
-                })
+        # Report and keep details in checklist order regardless of completion order
+        for detail, label in zip(details, labels):
+            print(f"Checking: {detail['check']}... {label}")
+        self.results["details"].extend(details)
         
         # Summary
         print()
@@ -118,11 +207,18 @@ class DeploymentChecklist:
         print(f"✅ Passed: {self.results['passed']}")
         print(f"⚠️  Warnings: {self.results['warnings']}")
         print(f"❌ Failed: {self.results['failed']}")
+        if self.results["skipped"]:
+            print(f"⏭️  Skipped: {self.results['skipped']}")
         print()
         
         # Save results
-        with open("deployment_checklist_results.json", "w") as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            Path("deployment_checklist_results.json").write_bytes(
+                orjson.dumps(self.results, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open("deployment_checklist_results.json", "w") as f:
+                json.dump(self.results, f, indent=2)
             
         # Generate fix script if needed
         if self.results["failed"] > 0:
@@ -130,6 +226,156 @@ class DeploymentChecklist:
             
         return self.results
         
+    def _record_result(self, details: List, labels: List, index: int, future=None, skipped_by=None) -> str:
+        """Count and store the outcome of one check and its console label; returns its status"""
+        check_name, _, severity = self.checks[index][:3]
+        
+        if skipped_by:
+            result = {
+                "status": "skipped",
+                "message": f"Skipped because {', '.join(skipped_by)} failed",
+                "fix": ""
+            }
+        else:
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"status": "error", "message": str(e), "fix": "Check implementation"}
+                
+        status = result["status"]
+        if status == "pass":
+            label = "✅ PASS"
+            self.results["passed"] += 1
+        elif status == "warning":
+            label = "⚠️  WARNING"
+            self.results["warnings"] += 1
+        elif status == "skipped":
+            label = "⏭️  SKIPPED"
+            self.results["skipped"] += 1
+        elif status == "error":
+            label = "❌ ERROR"
+            self.results["failed"] += 1
+        else:
+            label = "❌ FAIL"
+            self.results["failed"] += 1
+            
+        details[index] = {
+            "check": check_name,
+            "severity": severity,
+            "status": status,
+            "message": result.get("message", ""),
+            "fix": result.get("fix", "")
+        }
+        labels[index] = label
+        return status
+        
+    def _run_probes(self) -> Dict[str, Tuple[Optional[int], str]]:
+        """Run all CLI probes in one shell and return {name: (returncode, stdout)}.
+        
+        A probe that timed out is recorded with a returncode of None.
+        """
+        if not shutil.which("bash"):
+            # No shell to batch through, probe each command separately
+            probes = {}
+            for name, command in PROBE_COMMANDS.items():
+                if self._paths.get(command[0]):
+                    try:
+                        result = subprocess.run(command, capture_output=True, text=True,
+                                                timeout=PROBE_TIMEOUT, check=False)
+                        probes[name] = (result.returncode, result.stdout.strip())
+                    except subprocess.TimeoutExpired:
+                        probes[name] = (None, "")
+            return probes
+            
+        # coreutils timeout bounds each probe (exit 124); the overall limit is the backstop
+        prefix = f"timeout {PROBE_TIMEOUT} " if shutil.which("timeout") else ""
+        script = "; ".join(
+            f"echo {PROBE_MARKER} {name}; {prefix}{' '.join(command)} 2>/dev/null; rc=$?; echo; echo {PROBE_MARKER} rc $rc"
+            for name, command in PROBE_COMMANDS.items()
+        )
+        process = subprocess.Popen(["bash", "-c", script], stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL, text=True, start_new_session=True)
+        try:
+            stdout, _ = process.communicate(timeout=PROBE_TIMEOUT * len(PROBE_COMMANDS) + 1)
+        except subprocess.TimeoutExpired:
+            # Kill the whole group: a hung CLI child would otherwise keep the pipe open
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+            stdout, _ = process.communicate()
+            
+        # Split the combined stdout back into per-probe sections
+        probes = {}
+        current, lines = None, []
+        for line in stdout.splitlines():
+            if line.startswith(PROBE_MARKER):
+                tag = line[len(PROBE_MARKER):].split()
+                if tag[0] == "rc" and current:
+                    returncode = int(tag[1])
+                    probes[current] = (None if prefix and returncode == 124 else returncode,
+                                       "\n".join(lines).strip())
+                    current = None
+                else:
+                    current, lines = tag[0], []
+            elif current:
+                lines.append(line)
+        if current:
+            # The shell was killed while this probe was running
+            probes[current] = (None, "")
+        return probes
+        
+    def _read(self, path: str) -> Optional[bytes]:
+        """Read a project file once per run; None if it does not exist"""
+        if path not in self._file_cache:
+            try:
+                self._file_cache[path] = Path(path).read_bytes()
+            except (FileNotFoundError, IsADirectoryError):
+                self._file_cache[path] = None
+        return self._file_cache[path]
+        
+    def _read_text(self, path: str) -> Optional[str]:
+        """Cached file contents as text; None if it does not exist"""
+        data = self._read(path)
+        return data.decode("utf-8", errors="replace") if data is not None else None
+        
+    def _exists(self, path: str) -> bool:
+        """Whether a project file exists, using the read cache"""
+        return self._read(path) is not None
+        
+    def _package_json(self) -> Optional[Dict]:
+        """package.json parsed once per run; None if it does not exist"""
+        if self._pkgjson is None:
+            data = self._read("package.json")
+            if data is not None:
+                self._pkgjson = json.loads(data)
+        return self._pkgjson
+        
+    def _load_procfile(self) -> Optional[Dict[str, Optional[str]]]:
+        """Procfile parsed once per run into raw text and web command; None if missing"""
+        if self._procfile is None:
+            raw = self._read_text("Procfile")
+            if raw is None:
+                return None
+            raw = raw.strip()
+            self._procfile = {
+                "raw": raw,
+                "web_cmd": raw[4:].strip() if raw.startswith("web:") else None
+            }
+        return self._procfile
+        
+    def _probe_output(self, name: str) -> Optional[str]:
+        """Stdout of a successful probe, or None if it failed or was not run"""
+        returncode, output = self._probe_cache.get(name, (1, ""))
+        return output if returncode == 0 else None
+        
+    def _probe_timed_out(self, name: str) -> Optional[Dict]:
+        """Warning result if the named probe hit PROBE_TIMEOUT, else None"""
+        if name in self._probe_cache and self._probe_cache[name][0] is None:
+            command = " ".join(PROBE_COMMANDS[name])
+            return {"status": "warning", "message": f"`{command}` probe timed out"}
+        return None
+        
     def _check_python_version(self) -> Dict:
         """Check Python version"""
         version = sys.version_info
@@ -144,13 +390,13 @@ class DeploymentChecklist:
             
     def _check_node_installed(self) -> Dict:
         """Check if Node.js is installed"""
-        if shutil.which("node"):
-            try:
-                result = subprocess.run(["node", "--version"], 
-                                      capture_output=True, text=True)
-                return {"status": "pass", "message": result.stdout.strip()}
-            except:
-                pass
+        timed_out = self._probe_timed_out("node")
+        if timed_out:
+            return timed_out
+            
+        version = self._probe_output("node")
+        if version or self._paths["node"]:
+            return {"status": "pass", "message": version or ""}
         return {
             "status": "fail",
             "message": "Node.js not found",
@@ -159,13 +405,13 @@ class DeploymentChecklist:
         
     def _check_npm_installed(self) -> Dict:
         """Check if NPM is installed"""
-        if shutil.which("npm"):
-            try:
-                result = subprocess.run(["npm", "--version"], 
-                                      capture_output=True, text=True)
-                return {"status": "pass", "message": f"NPM {result.stdout.strip()}"}
-            except:
-                pass
+        timed_out = self._probe_timed_out("npm")
+        if timed_out:
+            return timed_out
+            
+        version = self._probe_output("npm")
+        if version or self._paths["npm"]:
+            return {"status": "pass", "message": f"NPM {version or ''}".strip()}
         return {
             "status": "fail",
             "message": "NPM not found",
@@ -174,7 +420,11 @@ class DeploymentChecklist:
         
     def _check_git_installed(self) -> Dict:
         """Check if Git is installed"""
-        if shutil.which("git"):
+        timed_out = self._probe_timed_out("git")
+        if timed_out:
+            return timed_out
+            
+        if self._probe_output("git") or self._paths["git"]:
             return {"status": "pass"}
         return {
             "status": "warning",
@@ -184,7 +434,7 @@ class DeploymentChecklist:
         
     def _check_railway_cli(self) -> Dict:
         """Check if Railway CLI is available"""
-        if shutil.which("railway"):
+        if self._paths["railway"]:
             return {"status": "pass"}
         return {
             "status": "warning",
@@ -194,16 +444,16 @@ class DeploymentChecklist:
         
     def _check_railway_auth(self) -> Dict:
         """Check Railway authentication"""
-        if not shutil.which("railway"):
+        if not self._paths["railway"]:
             return {"status": "warning", "message": "Railway CLI not installed"}
             
-        try:
-            result = subprocess.run(["railway", "whoami"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                return {"status": "pass", "message": f"Authenticated as {result.stdout.strip()}"}
-        except:
-            pass
+        timed_out = self._probe_timed_out("railway_whoami")
+        if timed_out:
+            return timed_out
+            
+        user = self._probe_output("railway_whoami")
+        if user is not None:
+            return {"status": "pass", "message": f"Authenticated as {user}"}
             
         return {
             "status": "warning",
@@ -213,16 +463,15 @@ class DeploymentChecklist:
         
     def _check_railway_project(self) -> Dict:
         """Check Railway project linking"""
-        if not shutil.which("railway"):
+        if not self._paths["railway"]:
             return {"status": "warning", "message": "Railway CLI not installed"}
             
-        try:
-            result = subprocess.run(["railway", "status"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                return {"status": "pass"}
-        except:
-            pass
+        timed_out = self._probe_timed_out("railway_status")
+        if timed_out:
+            return timed_out
+            
+        if self._probe_output("railway_status") is not None:
+            return {"status": "pass"}
             
         return {
             "status": "warning",
@@ -233,7 +482,7 @@ class DeploymentChecklist:
     def _check_backend_files(self) -> Dict:
         """Check backend files"""
         required_files = ["app.py"]
-        missing = [f for f in required_files if not Path(f).exists()]
+        missing = [f for f in required_files if not self._exists(f)]
         
         if not missing:
             return {"status": "pass"}
@@ -246,7 +495,7 @@ class DeploymentChecklist:
     def _check_frontend_files(self) -> Dict:
         """Check frontend files"""
         required_files = ["package.json", "next.config.mjs"]
-        missing = [f for f in required_files if not Path(f).exists()]
+        missing = [f for f in required_files if not self._exists(f)]
         
         if not missing:
             return {"status": "pass"}
@@ -261,8 +510,8 @@ class DeploymentChecklist:
         required_files = ["Procfile"]
         optional_files = ["runtime.txt", "railway.json", "railway.toml"]
         
-        missing_required = [f for f in required_files if not Path(f).exists()]
-        missing_optional = [f for f in optional_files if not Path(f).exists()]
+        missing_required = [f for f in required_files if not self._exists(f)]
+        missing_optional = [f for f in optional_files if not self._exists(f)]
         
         if missing_required:
             return {
@@ -282,15 +531,13 @@ class DeploymentChecklist:
         issues = []
         
         # Check Python dependencies
-        if not Path("requirements.txt").exists() and not Path("railway-requirements.txt").exists():
+        if not self._exists("requirements.txt") and not self._exists("railway-requirements.txt"):
             issues.append("No Python requirements file")
             
         # Check Node dependencies
-        if Path("package.json").exists():
-            with open("package.json") as f:
-                pkg = json.load(f)
-                if not pkg.get("dependencies"):
-                    issues.append("No Node dependencies in package.json")
+        pkg = self._package_json()
+        if pkg is not None and not pkg.get("dependencies"):
+            issues.append("No Node dependencies in package.json")
         
         if issues:
             return {
@@ -302,14 +549,47 @@ class DeploymentChecklist:
         
     def _check_syntax_errors(self) -> Dict:
         """Check for Python syntax errors"""
-        errors = []
-        
-        for py_file in Path(".").glob("*.py"):
+        use_cache = _syntax_cache_enabled()
+        cache = {}
+        if use_cache:
             try:
-                with open(py_file) as f:
-                    compile(f.read(), py_file, 'exec')
-            except SyntaxError as e:
-                errors.append(f"{py_file}: {e}")
+                cache = json.loads(SYNTAX_CACHE_FILE.read_text())
+            except (OSError, ValueError):
+                pass
+                
+        # Only files changed since they last compiled cleanly need compiling
+        files, keys = [], {}
+        for py_file in _iter_python_files():
+            path = str(py_file.resolve())
+            st = py_file.stat()
+            keys[py_file] = (path, [st.st_mtime_ns, st.st_size])
+            if cache.get(path) != keys[py_file][1]:
+                files.append(py_file)
+        
+        # compile() is CPU-bound and holds the GIL, so spread it across processes.
+        # This runs on a worker thread, so don't fork: use a forkserver (spawn on Windows)
+        if len(files) >= PARALLEL_COMPILE_MIN_FILES:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            with ProcessPoolExecutor(mp_context=context) as executor:
+                results = list(executor.map(_compile_one, files, chunksize=8))
+        else:
+            results = [_compile_one(p) for p in files]
+            
+        if use_cache and files:
+            for py_file, error in results:
+                path, key = keys[py_file]
+                if error:
+                    cache.pop(path, None)
+                else:
+                    cache[path] = key
+            try:
+                SYNTAX_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                SYNTAX_CACHE_FILE.write_text(json.dumps(cache))
+            except OSError:
+                pass
+            
+        errors = [f"{py_file}: {error}" for py_file, error in results if error]
                 
         if errors:
             return {
@@ -337,11 +617,10 @@ class DeploymentChecklist:
         issues = []
         
         # Check app.py for PORT usage
-        if Path("app.py").exists():
-            with open("app.py") as f:
-                content = f.read()
-                if "PORT" not in content and "port" not in content.lower():
-                    issues.append("app.py may not use PORT environment variable")
+        content = self._read_text("app.py")
+        if content is not None:
+            if "PORT" not in content and "port" not in content.lower():
+                issues.append("app.py may not use PORT environment variable")
                     
         if issues:
             return {
@@ -353,7 +632,7 @@ class DeploymentChecklist:
         
     def _check_node_modules(self) -> Dict:
         """Check if node_modules exists"""
-        if Path("package.json").exists() and not Path("node_modules").exists():
+        if self._exists("package.json") and not Path("node_modules").exists():
             return {
                 "status": "warning",
                 "message": "node_modules not found",
@@ -363,7 +642,7 @@ class DeploymentChecklist:
         
     def _check_python_packages(self) -> Dict:
         """Check if Python packages are installed"""
-        if Path("requirements.txt").exists():
+        if self._exists("requirements.txt"):
             try:
                 import flask
                 import gunicorn
@@ -378,42 +657,46 @@ class DeploymentChecklist:
         
     def _check_build_scripts(self) -> Dict:
         """Check build scripts in package.json"""
-        if Path("package.json").exists():
-            with open("package.json") as f:
-                pkg = json.load(f)
-                scripts = pkg.get("scripts", {})
-                
-                if "build" not in scripts:
-                    return {
-                        "status": "warning",
-                        "message": "No build script in package.json",
-                        "fix": "Add build script to package.json"
-                    }
+        pkg = self._package_json()
+        if pkg is not None:
+            scripts = pkg.get("scripts", {})
+            
+            if "build" not in scripts:
+                return {
+                    "status": "warning",
+                    "message": "No build script in package.json",
+                    "fix": "Add build script to package.json"
+                }
         return {"status": "pass"}
         
     def _check_sensitive_data(self) -> Dict:
         """Check for sensitive data in code"""
-        patterns = [
-            r"sk-[a-zA-Z0-9]{48}",  # OpenAI API key
-            r"ghp_[a-zA-Z0-9]{36}",  # GitHub token
-            r"password\s*=\s*[\"'][^\"']+[\"']",  # Hardcoded passwords
-        ]
-        
         issues = []
-        for py_file in Path(".").glob("**/*.py"):
-            if "venv" in str(py_file) or "node_modules" in str(py_file):
-                continue
-                
+        buffer = bytearray()
+        offsets, names = [], []
+        
+        def scan_buffer():
+            # One regex pass over the batch; map each hit back to its file
+            for match in SECRET_PATTERN.finditer(buffer):
+                name = names[bisect_right(offsets, match.start()) - 1]
+                if not issues or issues[-1] != name:
+                    issues.append(name)
+            buffer.clear()
+            offsets.clear()
+            names.clear()
+            
+        for py_file in _iter_python_files():
             try:
-                with open(py_file) as f:
-                    content = f.read()
-                    for pattern in patterns:
-                        import re
-                        if re.search(pattern, content):
-                            issues.append(str(py_file))
-                            break
-            except:
-                pass
+                content = py_file.read_bytes()
+            except OSError:
+                continue
+            offsets.append(len(buffer))
+            names.append(str(py_file))
+            buffer += content
+            buffer += FILE_SEPARATOR
+            if len(buffer) >= SCAN_BATCH_BYTES:
+                scan_buffer()
+        scan_buffer()
                 
         if issues:
             return {
@@ -425,16 +708,14 @@ class DeploymentChecklist:
         
     def _check_gitignore(self) -> Dict:
         """Check .gitignore configuration"""
-        if not Path(".gitignore").exists():
+        content = self._read_text(".gitignore")
+        if content is None:
             return {
                 "status": "warning",
                 "message": "No .gitignore file",
                 "fix": "Create .gitignore file"
             }
             
-        with open(".gitignore") as f:
-            content = f.read()
-            
         important_entries = ["venv", "node_modules", "__pycache__", ".env"]
         missing = [e for e in important_entries if e not in content]
         
@@ -448,17 +729,15 @@ class DeploymentChecklist:
         
     def _check_procfile(self) -> Dict:
         """Check Procfile validity"""
-        if not Path("Procfile").exists():
+        procfile = self._load_procfile()
+        if procfile is None:
             return {
                 "status": "fail",
                 "message": "No Procfile found",
                 "fix": "Create Procfile with: web: gunicorn app:app"
             }
             
-        with open("Procfile") as f:
-            content = f.read().strip()
-            
-        if not content.startswith("web:"):
+        if procfile["web_cmd"] is None:
             return {
                 "status": "fail",
                 "message": "Procfile must define web process",
@@ -468,15 +747,14 @@ class DeploymentChecklist:
         
     def _check_runtime(self) -> Dict:
         """Check runtime.txt"""
-        if not Path("runtime.txt").exists():
+        content = self._read_text("runtime.txt")
+        if content is None:
             return {
                 "status": "warning",
                 "message": "No runtime.txt found",
                 "fix": "Create runtime.txt with: python-3.11.0"
             }
-            
-        with open("runtime.txt") as f:
-            content = f.read().strip()
+        content = content.strip()
             
         if not content.startswith("python-"):
             return {
@@ -488,19 +766,14 @@ class DeploymentChecklist:
         
     def _check_start_command(self) -> Dict:
         """Check if start command works"""
-        if Path("Procfile").exists():
-            with open("Procfile") as f:
-                procfile = f.read().strip()
-                
-            # Extract command
-            if procfile.startswith("web:"):
-                command = procfile[4:].strip()
-                
-                # Basic validation
-                if "gunicorn" in command and "app:app" in command:
-                    return {"status": "pass"}
-                elif "python" in command:
-                    return {"status": "warning", "message": "Consider using gunicorn for production"}
+        procfile = self._load_procfile()
+        command = procfile["web_cmd"] if procfile else None
+        if command is not None:
+            # Basic validation
+            if "gunicorn" in command and "app:app" in command:
+                return {"status": "pass"}
+            elif "python" in command:
+                return {"status": "warning", "message": "Consider using gunicorn for production"}
                     
         return {
             "status": "warning",
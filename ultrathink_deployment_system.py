@@ -7,32 +7,217 @@ Uses context engineering and ultrathinking methodology.
 """
 
 import os
+import re
 import sys
+import atexit
+import queue
 import subprocess
 import json
 import time
 import platform
+import functools
 import shutil
-import requests
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 import hashlib
 import tempfile
 import zipfile
+import gzip
+from fnmatch import fnmatch
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler('ultrathink_deployment.log'),
-        logging.StreamHandler()
-    ]
-)
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+try:
+    import pygit2
+except ImportError:  # Fall back to the git CLI when pygit2 isn't installed
+    pygit2 = None
+
+try:
+    import pathspec
+except ImportError:  # Fall back to simple name matching when pathspec isn't installed
+    pathspec = None
+
+LOG_BUFFER_SIZE = 128 * 1024
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that lets the stream buffer fill instead of flushing every record.
+    
+    Errors are flushed straight away; everything else goes out when the
+    buffer fills or the handler is closed at shutdown.
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+        
+    def flush(self):
+        pass
+        
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.ERROR and self.stream:
+            self.stream.flush()
+
+
+# Configure logging: records are queued and written by a background listener,
+# so log calls never block the deployment on file or console I/O
+_log_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+_log_handlers = [BufferedFileHandler('ultrathink_deployment.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # listener handlers add the rest
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# Build output, caches and secrets that never belong in a deployment package
+# (gitignore syntax; a trailing slash matches directories only)
+PACKAGE_IGNORE_PATTERNS = [
+    "node_modules/", ".next/", ".git/", "__pycache__/", "dist/", "build/", "coverage/",
+    "*.pyc", "*.log", ".env"
+]
+PACKAGE_IGNORE = pathspec.PathSpec.from_lines("gitwildmatch", PACKAGE_IGNORE_PATTERNS) if pathspec else None
+
+# Threads used to write a batch of generated files
+WRITE_WORKERS = 8
+
+
+# Environment as it was at startup; probes and their later use read the same values
+ENV = dict(os.environ)
+
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """shutil.which, looked up once per command"""
+    return shutil.which(cmd)
+
+
+def _run(cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run without the close-fds pass.
+    
+    Python opens its own files close-on-exec, so skipping close_fds lets
+    subprocess use vfork/posix_spawn instead of closing every descriptor up
+    to the fd limit, which is slow in containers with a high ulimit -n.
+    """
+    kwargs.setdefault("close_fds", False)
+    return subprocess.run(cmd, **kwargs)
+
+
+def _jdump(obj: Any, path: str):
+    """Write obj as indented JSON in a single write, via orjson when available"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(obj, indent=2))
+
+
+def _digest(data: bytes) -> bytes:
+    """Short BLAKE2b digest used to compare file contents"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _write_if_changed(path: str, content) -> bool:
+    """Write content (str or bytes) to path unless the file already holds it.
+    
+    Returns True if the file was written. Re-running the generators then
+    leaves unchanged files, and their mtimes, alone.
+    """
+    data = content.encode() if isinstance(content, str) else content
+    target = Path(path)
+    try:
+        if target.stat().st_size == len(data) and _digest(target.read_bytes()) == _digest(data):
+            return False
+    except FileNotFoundError:
+        pass
+    target.write_bytes(data)
+    return True
+
+
+def _write_files(files: List[Tuple[str, Any]]):
+    """Write a batch of (path, content) pairs, skipping files that are unchanged.
+    
+    The files are written on a small thread pool so their syscalls overlap.
+    """
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        list(executor.map(lambda item: _write_if_changed(*item), files))
+
+
+def _scan_cwd() -> Tuple[set, set]:
+    """Names of the files and directories in the current directory, from one scandir"""
+    files, dirs = set(), set()
+    with os.scandir(".") as entries:
+        for entry in entries:
+            (dirs if entry.is_dir() else files).add(entry.name)
+    return files, dirs
+
+
+def _package_ignored(path: str, is_dir: bool = False) -> bool:
+    """Whether a relative path is excluded from deployment packages"""
+    if PACKAGE_IGNORE is not None:
+        return PACKAGE_IGNORE.match_file(path + "/" if is_dir else path)
+    name = os.path.basename(path)
+    return any(fnmatch(name, pattern.rstrip("/")) for pattern in PACKAGE_IGNORE_PATTERNS
+               if is_dir or not pattern.endswith("/"))
+
+
+# HTML report page, filled in with str.format (CSS braces are doubled)
+HTML_REPORT_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Deployment Report - {generated}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
+        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+        h1 {{ color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }}
+        h2 {{ color: #555; margin-top: 30px; }}
+        .status {{ padding: 10px; border-radius: 5px; margin: 10px 0; }}
+        .success {{ background: #d4edda; color: #155724; }}
+        .failure {{ background: #f8d7da; color: #721c24; }}
+        .warning {{ background: #fff3cd; color: #856404; }}
+        .method {{ background: #f8f9fa; padding: 15px; margin: 10px 0; border-left: 4px solid #007bff; }}
+        .error {{ background: #f8d7da; padding: 10px; margin: 5px 0; border-radius: 3px; }}
+        pre {{ background: #f4f4f4; padding: 10px; overflow-x: auto; }}
+        .timestamp {{ color: #666; font-size: 0.9em; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🚀 Ultrathink Deployment Report</h1>
+        <div class="timestamp">Generated: {generated}</div>
+        
+        <h2>Deployment Status</h2>
+        <div class="status {status_class}">
+            <strong>Status:</strong> {status_text}
+        </div>
+        
+        <h2>Methods Attempted</h2>
+        {methods_html}
+        
+        <h2>Errors Encountered</h2>
+        {errors_html}
+        
+        <h2>Next Steps</h2>
+        {next_steps_html}
+    </div>
+</body>
+</html>
+"""
+
+
 class DeploymentSystem:
     """Main deployment orchestrator with multiple fallback methods"""
     
@@ -80,21 +265,20 @@ class DeploymentSystem:
             "os": platform.system(),
             "os_version": platform.version(),
             "python_version": sys.version,
-            "node_installed": shutil.which("node") is not None,
-            "npm_installed": shutil.which("npm") is not None,
-            "railway_cli_installed": shutil.which("railway") is not None,
-            "git_installed": shutil.which("git") is not None,
-            "curl_installed": shutil.which("curl") is not None,
+            "node_installed": _which("node") is not None,
+            "npm_installed": _which("npm") is not None,
+            "railway_cli_installed": _which("railway") is not None,
+            "git_installed": _which("git") is not None,
+            "curl_installed": _which("curl") is not None,
             "env_vars": {
-                "RAILWAY_TOKEN": "RAILWAY_TOKEN" in os.environ,
-                "OPENAI_API_KEY": "OPENAI_API_KEY" in os.environ,
-                "NODE_ENV": os.environ.get("NODE_ENV", "not set")
+                "RAILWAY_TOKEN": "RAILWAY_TOKEN" in ENV,
+                "OPENAI_API_KEY": "OPENAI_API_KEY" in ENV,
+                "NODE_ENV": ENV.get("NODE_ENV", "not set")
             }
         }
         
         # Save analysis
-        with open("system_analysis.json", "w") as f:
-            json.dump(analysis, f, indent=2)
+        _jdump(analysis, "system_analysis.json")
             
         logger.info(f"System: {analysis['os']} {analysis['os_version']}")
         logger.info(f"Tools available: Node={analysis['node_installed']}, "
@@ -107,24 +291,16 @@ class DeploymentSystem:
         """Prepare all available deployment methods"""
         logger.info("Preparing deployment methods...")
         
-        # Method 1: Railway CLI (if available)
-        if shutil.which("railway"):
-            self.deployment_methods.append(RailwayCLIMethod())
-        
-        # Method 2: Railway CLI Auto-Installation
-        self.deployment_methods.append(RailwayAutoInstallMethod())
-        
-        # Method 3: Direct Railway API
-        self.deployment_methods.append(RailwayAPIMethod())
-        
-        # Method 4: Git-based deployment
-        self.deployment_methods.append(GitDeploymentMethod())
-        
-        # Method 5: Manual package deployment
-        self.deployment_methods.append(ManualPackageMethod())
-        
-        # Method 6: Web-based guide generation
-        self.deployment_methods.append(WebGuideMethod())
+        # Classes, not instances: each method is only built when its turn comes,
+        # and its pre_check decides whether it can run (e.g. Railway CLI installed)
+        self.deployment_methods = [
+            RailwayCLIMethod,           # Method 1: Railway CLI
+            RailwayAutoInstallMethod,   # Method 2: Railway CLI Auto-Installation
+            RailwayAPIMethod,           # Method 3: Direct Railway API
+            GitDeploymentMethod,        # Method 4: Git-based deployment
+            ManualPackageMethod,        # Method 5: Manual package deployment
+            WebGuideMethod              # Method 6: Web-based guide generation
+        ]
         
         logger.info(f"Prepared {len(self.deployment_methods)} deployment methods")
     
@@ -132,9 +308,14 @@ class DeploymentSystem:
         """Execute deployment using available methods"""
         logger.info("Starting deployment execution...")
         
-        for i, method in enumerate(self.deployment_methods, 1):
-            logger.info(f"\nTrying method {i}/{len(self.deployment_methods)}: {method.name}")
-            self.deployment_status["methods_tried"].append(method.name)
+        total = len(self.deployment_methods)
+        methods_tried = self.deployment_status["methods_tried"]
+        errors = self.deployment_status["errors"]
+        
+        for i, method_cls in enumerate(self.deployment_methods, 1):
+            method = method_cls()
+            logger.info(f"\nTrying method {i}/{total}: {method.name}")
+            methods_tried.append(method.name)
             
             try:
                 # Pre-check
@@ -153,14 +334,14 @@ class DeploymentSystem:
                     return True
                 else:
                     logger.warning(f"Method {method.name} failed: {result.get('error', 'Unknown error')}")
-                    self.deployment_status["errors"].append({
+                    errors.append({
                         "method": method.name,
                         "error": result.get("error", "Unknown error")
                     })
                     
             except Exception as e:
                 logger.error(f"Exception in {method.name}: {str(e)}")
-                self.deployment_status["errors"].append({
+                errors.append({
                     "method": method.name,
                     "error": str(e),
                     "type": "exception"
@@ -172,85 +353,60 @@ class DeploymentSystem:
         """Generate comprehensive deployment reports"""
         logger.info("Generating deployment reports...")
         
-        # Update final status
-        self.deployment_status["completed"] = datetime.now().isoformat()
+        # One timestamp for the whole report set, so all three agree
+        now = datetime.now()
+        generated = now.strftime('%Y-%m-%d %H:%M:%S')
         
-        # Save JSON report
-        with open("deployment_report.json", "w") as f:
-            json.dump(self.deployment_status, f, indent=2)
-        
-        # Generate HTML report
-        self.generate_html_report()
+        # Update final status
+        self.deployment_status["completed"] = now.isoformat()
         
-        # Generate markdown report
-        self.generate_markdown_report()
+        # JSON, HTML and markdown reports only read deployment_status, so write them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self._write_json_report),
+                executor.submit(self.generate_html_report, generated),
+                executor.submit(self.generate_markdown_report, generated)
+            ]
+            for future in futures:
+                future.result()
         
         logger.info("Reports generated: deployment_report.json, deployment_report.html, deployment_report.md")
     
-    def generate_html_report(self):
+    def _write_json_report(self):
+        """Save JSON deployment report"""
+        _jdump(self.deployment_status, "deployment_report.json")
+    
+    def generate_html_report(self, generated: Optional[str] = None):
         """Generate HTML deployment report"""
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Deployment Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        h1 {{ color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }}
-        h2 {{ color: #555; margin-top: 30px; }}
-        .status {{ padding: 10px; border-radius: 5px; margin: 10px 0; }}
-        .success {{ background: #d4edda; color: #155724; }}
-        .failure {{ background: #f8d7da; color: #721c24; }}
-        .warning {{ background: #fff3cd; color: #856404; }}
-        .method {{ background: #f8f9fa; padding: 15px; margin: 10px 0; border-left: 4px solid #007bff; }}
-        .error {{ background: #f8d7da; padding: 10px; margin: 5px 0; border-radius: 3px; }}
-        pre {{ background: #f4f4f4; padding: 10px; overflow-x: auto; }}
-        .timestamp {{ color: #666; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🚀 Ultrathink Deployment Report</h1>
-        <div class="timestamp">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
-        
-        <h2>Deployment Status</h2>
-        <div class="status {'success' if self.deployment_status['success'] else 'failure'}">
-            <strong>Status:</strong> {'✅ SUCCESS' if self.deployment_status['success'] else '❌ FAILED'}
-        </div>
-        
-        <h2>Methods Attempted</h2>
-        {self._generate_methods_html()}
-        
-        <h2>Errors Encountered</h2>
-        {self._generate_errors_html()}
-        
-        <h2>Next Steps</h2>
-        {self._generate_next_steps_html()}
-    </div>
-</body>
-</html>
-"""
-        with open("deployment_report.html", "w") as f:
-            f.write(html_content)
+        generated = generated or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        success = self.deployment_status['success']
+        html_content = HTML_REPORT_TEMPLATE.format(
+            generated=generated,
+            status_class='success' if success else 'failure',
+            status_text='✅ SUCCESS' if success else '❌ FAILED',
+            methods_html=self._generate_methods_html(),
+            errors_html=self._generate_errors_html(),
+            next_steps_html=self._generate_next_steps_html()
+        )
+        _write_if_changed("deployment_report.html", html_content)
     
     def _generate_methods_html(self) -> str:
         """Generate HTML for methods tried"""
-        html = ""
-        for method in self.deployment_status["methods_tried"]:
-            status = "✅" if method == self.deployment_status.get("successful_method") else "❌"
-            html += f'<div class="method">{status} {method}</div>'
-        return html
+        successful = self.deployment_status.get("successful_method")
+        return "".join(
+            f'<div class="method">{"✅" if method == successful else "❌"} {method}</div>'
+            for method in self.deployment_status["methods_tried"]
+        )
     
     def _generate_errors_html(self) -> str:
         """Generate HTML for errors"""
         if not self.deployment_status["errors"]:
             return '<p style="color: green;">No errors encountered!</p>'
         
-        html = ""
-        for error in self.deployment_status["errors"]:
-            html += f'<div class="error"><strong>{error["method"]}:</strong> {error["error"]}</div>'
-        return html
+        return "".join(
+            f'<div class="error"><strong>{error["method"]}:</strong> {error["error"]}</div>'
+            for error in self.deployment_status["errors"]
+        )
     
     def _generate_next_steps_html(self) -> str:
         """Generate next steps HTML"""
@@ -272,11 +428,12 @@ class DeploymentSystem:
             </ol>
             """
     
-    def generate_markdown_report(self):
+    def generate_markdown_report(self, generated: Optional[str] = None):
         """Generate markdown deployment report"""
+        generated = generated or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         md_content = f"""# Ultrathink Deployment Report
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated:** {generated}
 
 ## Status
 {'✅ **SUCCESS**' if self.deployment_status['success'] else '❌ **FAILED**'}
@@ -293,26 +450,25 @@ class DeploymentSystem:
 ## Deployment Logs
 Check `ultrathink_deployment.log` for detailed execution logs.
 """
-        with open("deployment_report.md", "w") as f:
-            f.write(md_content)
+        _write_if_changed("deployment_report.md", md_content)
     
     def _generate_methods_markdown(self) -> str:
         """Generate markdown for methods"""
-        md = ""
-        for method in self.deployment_status["methods_tried"]:
-            status = "✅" if method == self.deployment_status.get("successful_method") else "❌"
-            md += f"- {status} {method}\n"
-        return md
+        successful = self.deployment_status.get("successful_method")
+        return "".join(
+            f"- {'✅' if method == successful else '❌'} {method}\n"
+            for method in self.deployment_status["methods_tried"]
+        )
     
     def _generate_errors_markdown(self) -> str:
         """Generate markdown for errors"""
         if not self.deployment_status["errors"]:
             return "No errors encountered!"
         
-        md = ""
-        for error in self.deployment_status["errors"]:
-            md += f"- **{error['method']}:** {error['error']}\n"
-        return md
+        return "".join(
+            f"- **{error['method']}:** {error['error']}\n"
+            for error in self.deployment_status["errors"]
+        )
     
     def _generate_next_steps_markdown(self) -> str:
         """Generate next steps markdown"""
@@ -351,44 +507,50 @@ class RailwayCLIMethod(DeploymentMethod):
         
     def pre_check(self) -> bool:
         """Check if Railway CLI is available"""
-        return shutil.which("railway") is not None
+        return _which("railway") is not None
         
     def execute(self) -> Dict[str, Any]:
         """Execute deployment using Railway CLI"""
         try:
-            # Check authentication
-            result = subprocess.run(["railway", "whoami"], 
-                                  capture_output=True, text=True)
+            # Authentication and project-link checks are independent, run them together
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Only the return codes matter, so the output is discarded
+                whoami = executor.submit(_run, ["railway", "whoami"],
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15)
+                status = executor.submit(_run, ["railway", "status"],
+                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15)
+                result, status_result = whoami.result(), status.result()
+            
             if result.returncode != 0:
                 # Try to login
                 logger.info("Not authenticated, attempting login...")
-                if "RAILWAY_TOKEN" in os.environ:
-                    # Use token if available
-                    os.environ["RAILWAY_TOKEN"] = os.environ["RAILWAY_TOKEN"]
-                else:
+                # With a token set, the CLI picks it up from the environment it inherits
+                if "RAILWAY_TOKEN" not in ENV:
                     return {"success": False, "error": "Not authenticated and no token available"}
             
             # Check project linking
-            result = subprocess.run(["railway", "status"], 
-                                  capture_output=True, text=True)
-            if result.returncode != 0:
+            if status_result.returncode != 0:
                 logger.info("No project linked, attempting to link...")
                 # Try to create new project
-                result = subprocess.run(["railway", "init"], 
-                                      capture_output=True, text=True)
+                result = _run(["railway", "init"], 
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15)
                 if result.returncode != 0:
                     return {"success": False, "error": "Failed to initialize project"}
             
             # Deploy
             logger.info("Deploying with Railway CLI...")
-            result = subprocess.run(["railway", "up", "--detach"], 
-                                  capture_output=True, text=True)
+            # The upload itself can take a while, unlike the quick probes above
+            result = _run(["railway", "up", "--detach"], 
+                          capture_output=True, text=True, timeout=300)
             
             if result.returncode == 0:
-                # Get deployment URL
-                time.sleep(5)  # Wait for deployment to register
-                url_result = subprocess.run(["railway", "open", "--json"], 
-                                          capture_output=True, text=True)
+                # Get deployment URL, polling until the deployment has registered
+                for _ in range(10):
+                    url_result = _run(["railway", "open", "--json"], 
+                                      capture_output=True, text=True, timeout=30)
+                    if url_result.returncode == 0:
+                        break
+                    time.sleep(0.5)
                 
                 deployment_info = {
                     "method": "Railway CLI",
@@ -420,10 +582,10 @@ class RailwayAutoInstallMethod(DeploymentMethod):
     def pre_check(self) -> bool:
         """Check if we can install Railway CLI"""
         # Skip if already installed
-        if shutil.which("railway"):
+        if _which("railway"):
             return False
         # Need npm to install
-        return shutil.which("npm") is not None
+        return _which("npm") is not None
         
     def execute(self) -> Dict[str, Any]:
         """Install Railway CLI and deploy"""
@@ -431,14 +593,14 @@ class RailwayAutoInstallMethod(DeploymentMethod):
             logger.info("Installing Railway CLI...")
             
             # Install globally
-            result = subprocess.run(["npm", "install", "-g", "@railway/cli"], 
-                                  capture_output=True, text=True)
+            result = _run(["npm", "install", "-g", "@railway/cli"], 
+                          capture_output=True, text=True, timeout=300)
             
             if result.returncode != 0:
                 # Try local installation
                 logger.info("Global install failed, trying local...")
-                result = subprocess.run(["npm", "install", "@railway/cli"], 
-                                      capture_output=True, text=True)
+                result = _run(["npm", "install", "@railway/cli"], 
+                              capture_output=True, text=True, timeout=300)
                 
                 if result.returncode == 0:
                     # Use npx for local installation
@@ -447,6 +609,7 @@ class RailwayAutoInstallMethod(DeploymentMethod):
                     return {"success": False, "error": "Failed to install Railway CLI"}
             else:
                 railway_cmd = ["railway"]
+            _which.cache_clear()  # railway is on PATH now
             
             # Now use the CLI method
             cli_method = RailwayCLIMethod()
@@ -466,12 +629,12 @@ class RailwayAPIMethod(DeploymentMethod):
         
     def pre_check(self) -> bool:
         """Check if we have API token"""
-        return "RAILWAY_TOKEN" in os.environ
+        return "RAILWAY_TOKEN" in ENV
         
     def execute(self) -> Dict[str, Any]:
         """Deploy using Railway GraphQL API"""
         try:
-            token = os.environ.get("RAILWAY_TOKEN")
+            token = ENV.get("RAILWAY_TOKEN")
             if not token:
                 return {"success": False, "error": "No Railway token found"}
             
@@ -499,8 +662,7 @@ To deploy using Railway API:
    railway up
 """
             
-            with open("railway_api_instructions.txt", "w") as f:
-                f.write(instructions)
+            Path("railway_api_instructions.txt").write_text(instructions)
             
             return {
                 "success": False, 
@@ -516,20 +678,17 @@ To deploy using Railway API:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         package_name = f"deployment_{timestamp}.zip"
         
+        # Python files, requirements and configuration files
+        present_files, _ = _scan_cwd()
+        paths = sorted(name for name in present_files if name.endswith(".py"))
+        for name in ["requirements.txt", "railway-requirements.txt",
+                     "Procfile", "runtime.txt", "railway.json", "railway.toml"]:
+            if name in present_files:
+                paths.append(name)
+                
         with zipfile.ZipFile(package_name, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # Add Python files
-            for file in Path(".").glob("*.py"):
-                zf.write(file)
-            
-            # Add requirements
-            for req_file in ["requirements.txt", "railway-requirements.txt"]:
-                if Path(req_file).exists():
-                    zf.write(req_file)
-            
-            # Add configuration files
-            for config in ["Procfile", "runtime.txt", "railway.json", "railway.toml"]:
-                if Path(config).exists():
-                    zf.write(config)
+            for path in paths:
+                zf.write(path)
         
         return package_name
 
@@ -543,7 +702,7 @@ class GitDeploymentMethod(DeploymentMethod):
         
     def pre_check(self) -> bool:
         """Check if git is available"""
-        return shutil.which("git") is not None
+        return _which("git") is not None
         
     def execute(self) -> Dict[str, Any]:
         """Create git repository and generate deployment instructions"""
@@ -551,9 +710,7 @@ class GitDeploymentMethod(DeploymentMethod):
             # Initialize git if needed
             if not Path(".git").exists():
                 logger.info("Initializing git repository...")
-                subprocess.run(["git", "init"], check=True)
-                subprocess.run(["git", "add", "-A"], check=True)
-                subprocess.run(["git", "commit", "-m", "Initial commit for deployment"], check=True)
+                self._init_repository()
             
             # Generate deployment instructions
             instructions = """
@@ -603,8 +760,7 @@ class GitDeploymentMethod(DeploymentMethod):
 - FLASK_PORT=5000 (for Python backend)
 """
             
-            with open("git_deployment_guide.md", "w") as f:
-                f.write(instructions)
+            Path("git_deployment_guide.md").write_text(instructions)
             
             # Create automated git push script
             self._create_git_deploy_script()
@@ -618,6 +774,27 @@ class GitDeploymentMethod(DeploymentMethod):
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _init_repository(self):
+        """git init, add everything and make the initial commit"""
+        message = "Initial commit for deployment"
+        if pygit2 is not None:
+            # In-process with libgit2: no git process startup for each step
+            repo = pygit2.init_repository(".", bare=False)
+            repo.index.add_all()
+            repo.index.write()
+            tree = repo.index.write_tree()
+            try:
+                signature = repo.default_signature
+            except (KeyError, pygit2.GitError):  # user.name / user.email not configured
+                signature = pygit2.Signature("deploy", "deploy@local")
+            repo.create_commit("HEAD", signature, signature, message, tree, [])
+            return
+            
+        quiet = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL, "check": True}
+        _run(["git", "init"], **quiet)
+        _run(["git", "add", "-A"], **quiet)
+        _run(["git", "commit", "-m", message], **quiet)
+    
     def _create_git_deploy_script(self):
         """Create automated git deployment script"""
         script_content = """#!/bin/bash
@@ -647,10 +824,9 @@ else
 fi
 """
         
-        with open("git_deploy.sh", "w") as f:
-            f.write(script_content)
-        
-        os.chmod("git_deploy.sh", 0o755)
+        script_path = Path("git_deploy.sh")
+        script_path.write_text(script_content)
+        script_path.chmod(0o755)
 
 
 class ManualPackageMethod(DeploymentMethod):
@@ -667,9 +843,9 @@ class ManualPackageMethod(DeploymentMethod):
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             package_dir = f"railway_deployment_{timestamp}"
-            os.makedirs(package_dir, exist_ok=True)
+            zip_name = f"{package_dir}.zip"
             
-            # Copy essential files
+            # Essential files
             files_to_copy = [
                 "app.py",
                 "requirements.txt",
@@ -683,16 +859,7 @@ class ManualPackageMethod(DeploymentMethod):
                 "tailwind.config.ts",
                 "postcss.config.js"
             ]
-            
-            for file in files_to_copy:
-                if Path(file).exists():
-                    shutil.copy2(file, package_dir)
-            
-            # Copy directories
             dirs_to_copy = ["src", "public", "components"]
-            for dir_name in dirs_to_copy:
-                if Path(dir_name).exists():
-                    shutil.copytree(dir_name, os.path.join(package_dir, dir_name))
             
             # Create deployment instructions
             instructions = f"""
@@ -705,12 +872,13 @@ This package contains all files needed for deployment.
 1. **Via Railway Dashboard:**
    - Go to https://railway.app/new
    - Choose "Empty Project"
-   - Drag and drop this entire folder
+   - Extract this package and drag and drop the folder
    - Set environment variables
    - Deploy
 
 2. **Via Railway CLI:**
    ```bash
+   unzip {zip_name} -d {package_dir}
    cd {package_dir}
    railway init
    railway up
@@ -732,12 +900,30 @@ After deployment, check:
 - https://your-app.railway.app/api/health - Backend health check
 """
             
-            with open(os.path.join(package_dir, "DEPLOYMENT_INSTRUCTIONS.md"), "w") as f:
-                f.write(instructions)
-            
-            # Create zip file
-            zip_name = f"{package_dir}.zip"
-            shutil.make_archive(package_dir, 'zip', package_dir)
+            # Write everything straight into the zip, no staging copy of the tree
+            present_files, present_dirs = _scan_cwd()
+            paths = [file for file in files_to_copy if file in present_files]
+            skipped = 0
+            for dir_name in dirs_to_copy:
+                if dir_name not in present_dirs:
+                    continue
+                for root, dirs, files in os.walk(dir_name):
+                    # Prune ignored directories so their contents are never walked
+                    kept = [d for d in dirs if not _package_ignored(os.path.join(root, d), is_dir=True)]
+                    skipped += len(dirs) - len(kept)
+                    dirs[:] = kept
+                    for name in files:
+                        path = os.path.join(root, name)
+                        if _package_ignored(path):
+                            skipped += 1
+                        else:
+                            paths.append(path)
+            logger.info(f"Packaging {len(paths)} files, {skipped} ignored files/directories left out")
+            
+            with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+                for path in paths:
+                    zf.write(path)
+                zf.writestr("DEPLOYMENT_INSTRUCTIONS.md", instructions)
             
             logger.info(f"✅ Deployment package created: {zip_name}")
             
@@ -745,7 +931,7 @@ After deployment, check:
                 "success": True,
                 "info": {
                     "package": zip_name,
-                    "instructions": f"{package_dir}/DEPLOYMENT_INSTRUCTIONS.md"
+                    "instructions": f"{zip_name}:DEPLOYMENT_INSTRUCTIONS.md"
                 }
             }
             
@@ -753,51 +939,23 @@ After deployment, check:
             return {"success": False, "error": str(e)}
 
 
-class WebGuideMethod(DeploymentMethod):
-    """Generate interactive web-based deployment guide"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Web-based Deployment Guide"
-        
-    def execute(self) -> Dict[str, Any]:
-        """Generate comprehensive web guide"""
-        try:
-            logger.info("Generating interactive deployment guide...")
-            
-            # Create guide directory
-            guide_dir = "deployment_guide"
-            os.makedirs(guide_dir, exist_ok=True)
-            
-            # Generate main HTML guide
-            self._generate_main_guide(guide_dir)
-            
-            # Generate step-by-step pages
-            self._generate_step_pages(guide_dir)
-            
-            # Create assets
-            self._create_guide_assets(guide_dir)
-            
-            # Create local server script
-            self._create_server_script(guide_dir)
-            
-            logger.info(f"✅ Web guide created in {guide_dir}/")
-            logger.info("Open deployment_guide/index.html in your browser")
-            
-            return {
-                "success": True,
-                "info": {
-                    "guide_path": f"{guide_dir}/index.html",
-                    "server_script": f"{guide_dir}/serve.py"
-                }
-            }
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    def _generate_main_guide(self, guide_dir: str):
-        """Generate main guide HTML"""
-        html_content = """<!DOCTYPE html>
+# Method cards on the guide's landing page: (page, title, summary)
+GUIDE_METHOD_CARDS = [
+    ("method1-cli.html", "Method 1: Railway CLI", "The recommended approach using command line"),
+    ("method2-github.html", "Method 2: GitHub Integration", "Deploy directly from your GitHub repository"),
+    ("method3-dashboard.html", "Method 3: Dashboard Upload", "Upload files directly through Railway dashboard"),
+    ("method4-api.html", "Method 4: API Deployment", "Advanced deployment using Railway API")
+]
+GUIDE_METHOD_CARD = """                    <div class="method-card">
+                        <h3>{title}</h3>
+                        <p>{summary}</p>
+                        <a href="{page}" class="button">View Instructions</a>
+                    </div>
+"""
+
+# Landing page of the web guide; static, so assembled once at import
+GUIDE_INDEX_HTML = "".join([
+    """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -847,30 +1005,12 @@ railway up</code></pre>
             <section id="methods">
                 <h2>Deployment Methods</h2>
                 <div class="method-grid">
-                    <div class="method-card">
-                        <h3>Method 1: Railway CLI</h3>
-                        <p>The recommended approach using command line</p>
-                        <a href="method1-cli.html" class="button">View Instructions</a>
-                    </div>
-                    
-                    <div class="method-card">
-                        <h3>Method 2: GitHub Integration</h3>
-                        <p>Deploy directly from your GitHub repository</p>
-                        <a href="method2-github.html" class="button">View Instructions</a>
-                    </div>
-                    
-                    <div class="method-card">
-                        <h3>Method 3: Dashboard Upload</h3>
-                        <p>Upload files directly through Railway dashboard</p>
-                        <a href="method3-dashboard.html" class="button">View Instructions</a>
-                    </div>
-                    
-                    <div class="method-card">
-                        <h3>Method 4: API Deployment</h3>
-                        <p>Advanced deployment using Railway API</p>
-                        <a href="method4-api.html" class="button">View Instructions</a>
-                    </div>
-                </div>
+""",
+    "                    \n".join(
+        GUIDE_METHOD_CARD.format(page=page, title=title, summary=summary)
+        for page, title, summary in GUIDE_METHOD_CARDS
+    ),
+    """                </div>
             </section>
             
             <section id="troubleshooting">
@@ -904,42 +1044,41 @@ railway up</code></pre>
     <script src="script.js"></script>
 </body>
 </html>"""
-        
-        with open(os.path.join(guide_dir, "index.html"), "w") as f:
-            f.write(html_content)
-    
-    def _generate_step_pages(self, guide_dir: str):
-        """Generate individual method pages"""
-        methods = {
-            "method1-cli.html": self._generate_cli_method(),
-            "method2-github.html": self._generate_github_method(),
-            "method3-dashboard.html": self._generate_dashboard_method(),
-            "method4-api.html": self._generate_api_method()
-        }
-        
-        for filename, content in methods.items():
-            with open(os.path.join(guide_dir, filename), "w") as f:
-                f.write(content)
-    
-    def _generate_cli_method(self) -> str:
-        """Generate CLI method page"""
-        return """<!DOCTYPE html>
+])
+
+
+# Shared scaffolding of the guide's method pages
+GUIDE_PAGE_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Railway CLI Deployment</title>
+    <title>{title}</title>
     <link rel="stylesheet" href="style.css">
 </head>
 <body>
     <div class="container">
         <header>
-            <h1>Railway CLI Deployment</h1>
+            <h1>{title}</h1>
             <a href="index.html" class="back-link">← Back to Guide</a>
         </header>
         
         <main>
-            <div class="step">
+"""
+GUIDE_PAGE_FOOT = """        </main>
+    </div>
+    <script src="script.js"></script>
+</body>
+</html>"""
+
+
+def _guide_page(title: str, main: str) -> str:
+    """A method page: shared head and foot around the page's <main> content"""
+    return "".join([GUIDE_PAGE_HEAD.format(title=title), main, GUIDE_PAGE_FOOT])
+
+
+# Method pages of the web guide
+GUIDE_CLI_HTML = _guide_page("Railway CLI Deployment", """            <div class="step">
                 <h2>Step 1: Install Railway CLI</h2>
                 <div class="tab-container">
                     <div class="tab-buttons">
@@ -988,31 +1127,9 @@ railway variables set NODE_ENV=production</code></pre>
                 <pre><code>railway open</code></pre>
                 <p>Opens your deployed application in the browser.</p>
             </div>
-        </main>
-    </div>
-    <script src="script.js"></script>
-</body>
-</html>"""
-    
-    def _generate_github_method(self) -> str:
-        """Generate GitHub method page"""
-        return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitHub Integration Deployment</title>
-    <link rel="stylesheet" href="style.css">
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>GitHub Integration Deployment</h1>
-            <a href="index.html" class="back-link">← Back to Guide</a>
-        </header>
-        
-        <main>
-            <div class="step">
+""")
+
+GUIDE_GITHUB_HTML = _guide_page("GitHub Integration Deployment", """            <div class="step">
                 <h2>Step 1: Push Code to GitHub</h2>
                 <pre><code>git init
 git add -A
@@ -1056,31 +1173,9 @@ git push -u origin main</code></pre>
                 <p>Click "Deploy" - Railway will build and deploy automatically!</p>
                 <p>Future pushes to GitHub will trigger automatic deployments.</p>
             </div>
-        </main>
-    </div>
-    <script src="script.js"></script>
-</body>
-</html>"""
-    
-    def _generate_dashboard_method(self) -> str:
-        """Generate dashboard method page"""
-        return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dashboard Upload Deployment</title>
-    <link rel="stylesheet" href="style.css">
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>Dashboard Upload Deployment</h1>
-            <a href="index.html" class="back-link">← Back to Guide</a>
-        </header>
-        
-        <main>
-            <div class="step">
+""")
+
+GUIDE_DASHBOARD_HTML = _guide_page("Dashboard Upload Deployment", """            <div class="step">
                 <h2>Step 1: Prepare Files</h2>
                 <p>Ensure you have these files in your project:</p>
                 <ul>
@@ -1124,31 +1219,9 @@ Start Command: npm start</code></pre>
                 <h2>Step 5: Deploy</h2>
                 <p>Click "Deploy" and monitor the build logs.</p>
             </div>
-        </main>
-    </div>
-    <script src="script.js"></script>
-</body>
-</html>"""
-    
-    def _generate_api_method(self) -> str:
-        """Generate API method page"""
-        return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>API Deployment</title>
-    <link rel="stylesheet" href="style.css">
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>API Deployment</h1>
-            <a href="index.html" class="back-link">← Back to Guide</a>
-        </header>
-        
-        <main>
-            <div class="step">
+""")
+
+GUIDE_API_HTML = _guide_page("API Deployment", """            <div class="step">
                 <h2>Step 1: Get API Token</h2>
                 <ol>
                     <li>Go to Railway dashboard</li>
@@ -1183,16 +1256,10 @@ railway login --token $RAILWAY_TOKEN</code></pre>
   -H "Content-Type: application/json" \\
   -d '{"query": "{ me { projects { edges { node { id name } } } } }"}'</code></pre>
             </div>
-        </main>
-    </div>
-    <script src="script.js"></script>
-</body>
-</html>"""
-    
-    def _create_guide_assets(self, guide_dir: str):
-        """Create CSS and JavaScript for the guide"""
-        # CSS
-        css_content = """
+""")
+
+# Guide stylesheet and script
+GUIDE_STYLE_CSS = """
 :root {
     --primary: #7C3AED;
     --secondary: #10B981;
@@ -1458,12 +1525,8 @@ footer {
     }
 }
 """
-        
-        with open(os.path.join(guide_dir, "style.css"), "w") as f:
-            f.write(css_content)
-        
-        # JavaScript
-        js_content = """
+
+GUIDE_SCRIPT_JS = """
 // Update timestamp
 document.getElementById('timestamp')?.innerHTML = new Date().toLocaleString();
 
@@ -1622,17 +1685,12 @@ style.textContent = `
 `;
 document.head.appendChild(style);
 """
-        
-        with open(os.path.join(guide_dir, "script.js"), "w") as f:
-            f.write(js_content)
-    
-    def _create_server_script(self, guide_dir: str):
-        """Create a simple server script for the guide"""
-        server_script = """#!/usr/bin/env python3
+
+# Local server shipped with the guide as serve.py
+GUIDE_SERVE_PY = """#!/usr/bin/env python3
 # Simple HTTP server for deployment guide
 
 import http.server
-import socketserver
 import os
 import webbrowser
 from pathlib import Path
@@ -1642,6 +1700,28 @@ PORT = 8888
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=os.path.dirname(__file__), **kwargs)
+    
+    def send_head(self):
+        # Serve the precompressed .gz sibling to clients that accept gzip
+        path = self.translate_path(self.path)
+        if self.path.split("?", 1)[0].endswith("/"):
+            path = os.path.join(path, "index.html")
+        if "gzip" not in self.headers.get("Accept-Encoding", "") or not os.path.isfile(path + ".gz"):
+            return super().send_head()
+        f = open(path + ".gz", "rb")
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        return f
+    
+    def send_response(self, code, message=None):
+        super().send_response(code, message)
+        if code == 200:
+            # The guide is static, let the browser reuse what it already has
+            self.send_header("Cache-Control", "public, max-age=3600")
 
 print(f"Starting deployment guide server on http://localhost:{PORT}")
 print("Press Ctrl+C to stop")
@@ -1649,8 +1729,8 @@ print("Press Ctrl+C to stop")
 # Change to guide directory
 os.chdir(os.path.dirname(__file__))
 
-# Start server
-with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+# Start server; one thread per request so several tabs load in parallel
+with http.server.ThreadingHTTPServer(("", PORT), MyHTTPRequestHandler) as httpd:
     # Open browser
     webbrowser.open(f'http://localhost:{PORT}')
     
@@ -1659,44 +1739,127 @@ with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
     except KeyboardInterrupt:
         print("\\nServer stopped")
 """
+
+# Every guide file, UTF-8 encoded once at import and written as bytes
+GUIDE_FILES = {
+    "index.html": GUIDE_INDEX_HTML.encode(),
+    "method1-cli.html": GUIDE_CLI_HTML.encode(),
+    "method2-github.html": GUIDE_GITHUB_HTML.encode(),
+    "method3-dashboard.html": GUIDE_DASHBOARD_HTML.encode(),
+    "method4-api.html": GUIDE_API_HTML.encode(),
+    "style.css": GUIDE_STYLE_CSS.encode(),
+    "script.js": GUIDE_SCRIPT_JS.encode(),
+    "serve.py": GUIDE_SERVE_PY.encode()
+}
+
+
+class WebGuideMethod(DeploymentMethod):
+    """Generate interactive web-based deployment guide"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Web-based Deployment Guide"
         
-        script_path = os.path.join(guide_dir, "serve.py")
-        with open(script_path, "w") as f:
-            f.write(server_script)
+    def execute(self) -> Dict[str, Any]:
+        """Generate comprehensive web guide"""
+        try:
+            logger.info("Generating interactive deployment guide...")
+            
+            # Create guide directory
+            guide_dir = "deployment_guide"
+            os.makedirs(guide_dir, exist_ok=True)
+            
+            # Every page, asset and the server script, written in one batch
+            _write_files([(os.path.join(guide_dir, name), data)
+                          for name, data in self._build_guide_manifest()])
+            os.chmod(os.path.join(guide_dir, "serve.py"), 0o755)
+            
+            logger.info(f"✅ Web guide created in {guide_dir}/")
+            logger.info("Open deployment_guide/index.html in your browser")
+            
+            return {
+                "success": True,
+                "info": {
+                    "guide_path": f"{guide_dir}/index.html",
+                    "server_script": f"{guide_dir}/serve.py"
+                }
+            }
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    def _build_guide_manifest(self) -> List[Tuple[str, bytes]]:
+        """All guide files as (name relative to the guide directory, content).
         
-        os.chmod(script_path, 0o755)
+        Pages, CSS and JS also get a gzip-9 .gz sibling for serve.py to send to
+        browsers that accept it; mtime=0 keeps the output identical across runs.
+        """
+        manifest = list(GUIDE_FILES.items())
+        for name, data in GUIDE_FILES.items():
+            if name.endswith((".html", ".css", ".js")):
+                manifest.append((name + ".gz", gzip.compress(data, 9, mtime=0)))
+        return manifest
 
 
 # Additional helper classes for monitoring and validation
 
+@dataclass(slots=True)
+class CheckResult:
+    """Outcome of one health check"""
+    status: str
+    error: Optional[str] = None
+    value: Any = None
+
+
 class DeploymentMonitor:
     """Monitor deployment progress and health"""
     
     def __init__(self, deployment_url: str = None):
         self.deployment_url = deployment_url
-        self.checks = []
+        self.checks: Tuple[Tuple[str, Any], ...] = ()
+        self._results: Dict[str, Optional[CheckResult]] = {}
         
     def add_check(self, name: str, check_func):
         """Add a health check"""
-        self.checks.append((name, check_func))
+        self.checks += ((name, check_func),)
+        # Sized once here so run_checks only fills it in
+        self._results = dict.fromkeys(name for name, _ in self.checks)
         
-    def run_checks(self) -> Dict[str, Any]:
+    def run_checks(self) -> Dict[str, CheckResult]:
         """Run all health checks"""
-        results = {}
+        results = self._results
         for name, check_func in self.checks:
             try:
-                results[name] = check_func()
+                results[name] = CheckResult("ok", value=check_func())
             except Exception as e:
-                results[name] = {"status": "error", "error": str(e)}
-        return results
+                results[name] = CheckResult("error", error=str(e))
+        return dict(results)
+
+
+# A "dependencies" key whose object has at least one entry
+NODE_DEPENDENCIES_PATTERN = re.compile(rb'"dependencies"\s*:\s*\{\s*[^\s}]')
 
 
 class DeploymentValidator:
     """Validate deployment readiness"""
     
+    # Results are reused for this long per working directory
+    CACHE_SECONDS = 5
+    
+    @staticmethod
+    def _cache_key() -> Tuple[str, int]:
+        """(working directory, current CACHE_SECONDS window)"""
+        return os.getcwd(), int(time.monotonic() // DeploymentValidator.CACHE_SECONDS)
+    
     @staticmethod
     def validate_project_structure() -> Dict[str, bool]:
         """Validate project has required files"""
+        return dict(DeploymentValidator._project_structure(*DeploymentValidator._cache_key()))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _project_structure(cwd: str, window: int) -> Dict[str, bool]:
+        """Required-file check for cwd, cached per time window"""
         required_files = {
             "backend": ["app.py", "requirements.txt"],
             "frontend": ["package.json", "next.config.mjs"],
@@ -1705,28 +1868,29 @@ class DeploymentValidator:
         
         validation = {}
         for category, files in required_files.items():
-            validation[category] = all(Path(f).exists() for f in files)
+            validation[category] = all(Path(cwd, f).exists() for f in files)
             
         return validation
     
     @staticmethod
     def validate_dependencies() -> Dict[str, Any]:
         """Validate dependencies are properly specified"""
+        return dict(DeploymentValidator._dependencies(*DeploymentValidator._cache_key()))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _dependencies(cwd: str, window: int) -> Dict[str, Any]:
+        """Dependency check for cwd, cached per time window"""
         validation = {}
         
-        # Check Python dependencies
-        if Path("requirements.txt").exists():
-            with open("requirements.txt") as f:
-                deps = f.read().strip()
-                validation["python_deps"] = len(deps.split('\n')) > 0
-        else:
-            validation["python_deps"] = False
-            
-        # Check Node dependencies
-        if Path("package.json").exists():
-            with open("package.json") as f:
-                pkg = json.load(f)
-                validation["node_deps"] = bool(pkg.get("dependencies"))
+        # Check Python dependencies (an existing requirements.txt is enough)
+        validation["python_deps"] = Path(cwd, "requirements.txt").exists()
+            
+        # Check Node dependencies: a non-empty "dependencies" object, found by
+        # scanning the raw bytes instead of parsing the whole package.json
+        package_json = Path(cwd, "package.json")
+        if package_json.exists():
+            validation["node_deps"] = NODE_DEPENDENCIES_PATTERN.search(package_json.read_bytes()) is not None
         else:
             validation["node_deps"] = False
             
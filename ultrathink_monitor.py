@@ -7,39 +7,291 @@ Continuous monitoring system for deployment status and health.
 
 import os
 import sys
+import atexit
 import time
 import json
-import requests
+import queue
 import subprocess
 import threading
 import logging
 import re
 import shutil
+import sched
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import signal
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # records are encoded with the json module
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # probes go through a pooled requests session instead
+    import requests
+    from requests.adapters import HTTPAdapter
+
+try:
+    import h2  # httpx needs it to speak HTTP/2
+except ImportError:
+    h2 = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request at INFO, which would bury the monitor's own output
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Longest a health check may run before it is recorded as timed out
+CHECK_TIMEOUT_SECONDS = 30
+
+# Shared by every round so checks run concurrently without spawning threads per round
+HEALTH_CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-check")
+
+# Separate pool for the API endpoint fan-out, which itself runs inside a health check
+PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="endpoint-probe")
+
+# Log levels in order of precedence, with the words that mark a line as that level
+LOG_LEVEL_WORDS = [
+    ("CRITICAL", r"critical|fatal"),
+    ("ERROR", r"error|exception|failed"),
+    ("WARNING", r"warning|warn"),
+    ("CRASH", r"crash|segfault|terminated")
+]
+LOG_LEVEL_PATTERN = re.compile(
+    "|".join(f"(?P<{level}>{words})" for level, words in LOG_LEVEL_WORDS),
+    re.IGNORECASE
+)
+
+# Words that mark a build log line as an error
+BUILD_ERROR_PATTERN = re.compile(r"error|failed|exception|crash", re.IGNORECASE)
+
+# Records waiting for the JSON lines writer, and the most it appends at once
+JSONL_QUEUE_SIZE = 10000
+JSONL_BATCH_SIZE = 500
+
+# Where deployment information is read from, first match wins
+DEPLOYMENT_INFO_FILES = (
+    "last_deployment.json",
+    "deployment_report.json",
+    ".railway/deployment.json"
+)
+
+# Paths probed by the API health check
+API_ENDPOINTS = (
+    "/api/health",
+    "/api/status",
+    "/health",
+    "/api/campaign/create"
+)
+
+# ANSI escape that homes the cursor and clears the screen
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# Top of every dashboard frame
+DASHBOARD_BANNER = "\n".join([
+    "=" * 80,
+    "ULTRATHINK DEPLOYMENT MONITOR DASHBOARD",
+    "=" * 80
+])
+
+# Status history entries kept for the dashboard and overall status
+STATUS_HISTORY_LENGTH = 100
+
+# Lines of history `railway logs` replays each time the stream is (re)opened
+LOG_TAIL_LINES = 10
+
+# Seconds between the overall status samples counted towards the unhealthy alert
+ALERT_ROUND_SECONDS = 60
+
+
+def _http_client():
+    """Client shared by the HTTP probes
+    
+    With httpx the API endpoint probes are multiplexed over one HTTP/2
+    connection when h2 is installed; otherwise a requests session pools
+    HTTP/1.1 connections.
+    """
+    headers = {"User-Agent": "ultrathink-monitor"}
+    if httpx:
+        return httpx.Client(
+            http2=h2 is not None,
+            headers=headers,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8)
+        )
+        
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(headers)
+    return session
+
+
+# Errors raised by the HTTP client for a failed request
+HTTP_ERRORS = (httpx.HTTPError,) if httpx else (requests.RequestException,)
+
+
+def _kill_process_group(process: subprocess.Popen):
+    """Kill a child started with start_new_session, along with anything it spawned"""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        # No process groups on Windows; the group may also already be gone
+        process.kill()
+
+
+def _run_railway(args: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """Run a railway command, killing its whole process group if it times out"""
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True
+    )
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(process)
+        process.communicate()
+        raise
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+
+_last_timestamp = (0, "")
+
+
+def _timestamp() -> str:
+    """Current local time in ISO format to the second, reused within that second"""
+    global _last_timestamp
+    second = int(time.time())
+    if second != _last_timestamp[0]:
+        _last_timestamp = (second, datetime.fromtimestamp(second).isoformat())
+    return _last_timestamp[1]
+
+
+def _jsonl_line(record: Dict[str, Any]) -> bytes:
+    """One record encoded as a JSON line"""
+    if orjson:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record) + "\n").encode()
+
+
+class JsonlWriter:
+    """Append-only JSON lines file, written in batches by a background thread
+    
+    One queue and one writer thread are shared by every JsonlWriter, so the
+    monitoring threads never wait on disk.
+    """
+    
+    _queue = queue.Queue(maxsize=JSONL_QUEUE_SIZE)
+    _thread = None
+    _thread_lock = threading.Lock()
+    
+    def __init__(self, path: str):
+        self.path = path
+        with JsonlWriter._thread_lock:
+            if JsonlWriter._thread is None:
+                JsonlWriter._thread = threading.Thread(target=JsonlWriter._writer_loop, daemon=True)
+                JsonlWriter._thread.start()
+                atexit.register(JsonlWriter._shutdown)
+                
+    def write(self, record: Dict[str, Any]):
+        """Queue one record; it is appended with the writer's next batch"""
+        try:
+            self._queue.put_nowait((self.path, _jsonl_line(record)))
+        except queue.Full:
+            logger.warning(f"Dropped a record for {self.path}, the writer is behind")
+            
+    @classmethod
+    def _writer_loop(cls):
+        """Drain the queue, appending each batch with one write per file"""
+        files = {}
+        while True:
+            batch = [cls._queue.get()]
+            while len(batch) < JSONL_BATCH_SIZE:
+                try:
+                    batch.append(cls._queue.get_nowait())
+                except queue.Empty:
+                    break
+                    
+            lines_by_path = {}
+            for item in batch:
+                if item is not None:
+                    lines_by_path.setdefault(item[0], []).append(item[1])
+                    
+            for path, lines in lines_by_path.items():
+                try:
+                    if path not in files:
+                        files[path] = open(path, "ab")
+                    files[path].writelines(lines)
+                    files[path].flush()
+                except OSError as e:
+                    logger.error(f"Could not write {path}: {e}")
+                    
+            # None is queued at exit, after every record
+            if None in batch:
+                for f in files.values():
+                    f.close()
+                return
+                
+    @classmethod
+    def _shutdown(cls):
+        cls._queue.put(None)
+        cls._thread.join(timeout=5)
+
 
 class DeploymentMonitor:
     """Advanced deployment monitoring system"""
     
     def __init__(self):
         self.monitoring = True
+        # Resolved once; checks and the log stream run the CLI by absolute path
+        self._railway_bin = shutil.which("railway")
         self.deployment_info = self._load_deployment_info()
+        self._refresh_urls()
         self.health_checks = []
+        self._events = JsonlWriter("deployment_events.jsonl")
+        self._alerts = JsonlWriter("deployment_alerts.jsonl")
+        self._recent_log_lines = deque(maxlen=LOG_TAIL_LINES)
+        
+        # Error verdict for each line of the last build log sample
+        self._build_log_verdicts: Dict[str, bool] = {}
+        
+        # Health checks in flight as (future, start time), and those of them
+        # already recorded as timed out
+        self._running: Dict[str, Tuple[Any, float]] = {}
+        self._timed_out = set()
+        self._consecutive_unhealthy = 0
+        self._last_alert_round = None
+        
+        # Overall status, cached until the next check result is recorded
+        self._status_cache = "unknown"
+        self._status_dirty = True
+        self._status_lock = threading.Lock()
+        # Latest result per check as (monotonic time, result); reused until
+        # the check's interval has passed
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # One pooled client so probes reuse kept-alive connections
+        self._session = _http_client()
         self.metrics = {
             "start_time": datetime.now(),
             "checks_performed": 0,
             "failures": 0,
             "last_check": None,
-            "status_history": []
+            "status_history": deque(maxlen=STATUS_HISTORY_LENGTH)
         }
         
         # Set up signal handlers
@@ -54,13 +306,9 @@ class DeploymentMonitor:
         
     def _load_deployment_info(self) -> Dict[str, Any]:
         """Load deployment information"""
-        info_files = [
-            "last_deployment.json",
-            "deployment_report.json",
-            ".railway/deployment.json"
-        ]
+        self._info_signature = self._deployment_info_signature()
         
-        for file in info_files:
+        for file in DEPLOYMENT_INFO_FILES:
             if Path(file).exists():
                 try:
                     with open(file) as f:
@@ -70,39 +318,81 @@ class DeploymentMonitor:
                     
         return {}
         
+    @staticmethod
+    def _deployment_info_signature() -> Tuple[Optional[int], ...]:
+        """Modification time of each deployment info file, None where missing"""
+        signature = []
+        for file in DEPLOYMENT_INFO_FILES:
+            try:
+                signature.append(os.stat(file).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+        
+    def _refresh_deployment_info(self):
+        """Reload deployment information if any of its files changed"""
+        if self._deployment_info_signature() == self._info_signature:
+            return
+        self.deployment_info = self._load_deployment_info()
+        self._refresh_urls()
+        logger.info("Deployment information changed, reloaded it")
+        
+    def _refresh_urls(self):
+        """Resolve the API endpoint URLs from deployment_info; call again if it changes"""
+        base_url = self.deployment_info.get("url") or self.deployment_info.get("app_url")
+        if base_url:
+            base_url = base_url.rstrip("/")
+            self._api_urls = [(endpoint, f"{base_url}{endpoint}") for endpoint in API_ENDPOINTS]
+        else:
+            self._api_urls = []
+        
     def start_monitoring(self):
         """Start the monitoring loop"""
         logger.info("=" * 60)
         logger.info("ULTRATHINK DEPLOYMENT MONITOR STARTED")
         logger.info("=" * 60)
         
+        # Windows consoles only interpret ANSI escapes once VT mode is on,
+        # which running any command through the shell enables
+        if os.name == "nt":
+            os.system("")
+            
         # Set up health checks
         self._setup_health_checks()
         
-        # Start monitoring threads
-        threads = [
-            threading.Thread(target=self._health_check_loop),
-            threading.Thread(target=self._log_monitor_loop),
-            threading.Thread(target=self._metrics_reporter_loop),
-            threading.Thread(target=self._alert_loop)
-        ]
+        # The log stream blocks on its pipe, so it keeps a thread of its own
+        threading.Thread(target=self._log_monitor_loop, daemon=True).start()
+        
+        # Everything else is a periodic task on one scheduler in this thread
+        self._scheduler = sched.scheduler(time.monotonic, time.sleep)
+        self._every(1, self._run_health_checks)
+        self._every(300, self._generate_metrics_report)  # Report every 5 minutes
+        self._every(5, self._display_dashboard)  # Update dashboard every 5 seconds
         
-        for thread in threads:
-            thread.daemon = True
-            thread.start()
-            
-        # Main monitoring loop
         try:
+            # Sleep until the next task is due; stop as soon as monitoring ends
             while self.monitoring:
-                self._display_dashboard()
-                time.sleep(5)  # Update dashboard every 5 seconds
+                time.sleep(self._scheduler.run(blocking=False) or 0)
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
             
+    def _every(self, interval: float, task):
+        """Run task now, then every interval seconds while monitoring"""
+        def run():
+            if not self.monitoring:
+                return
+            try:
+                task()
+            except Exception as e:
+                logger.error(f"{task.__name__} failed: {e}")
+            self._scheduler.enter(interval, 0, run)
+            
+        self._scheduler.enter(0, 0, run)
+            
     def _setup_health_checks(self):
         """Configure health checks"""
         # Railway-specific checks
-        if shutil.which("railway"):
+        if self._railway_bin:
             self.health_checks.append({
                 "name": "Railway CLI Status",
                 "func": self._check_railway_cli,
@@ -131,43 +421,62 @@ class DeploymentMonitor:
             "interval": 120
         })
         
-    def _health_check_loop(self):
-        """Run health checks continuously"""
-        while self.monitoring:
-            for check in self.health_checks:
-                try:
-                    result = check["func"]()
-                    self._record_check_result(check["name"], result)
-                except Exception as e:
-                    logger.error(f"Health check '{check['name']}' failed: {e}")
-                    self._record_check_result(check["name"], {
-                        "status": "error",
-                        "error": str(e)
-                    })
-                    
-            time.sleep(10)  # Run checks every 10 seconds
+    def _run_health_checks(self):
+        """Record finished health checks and start the ones that are due"""
+        self._refresh_deployment_info()
+        now = time.monotonic()
+        
+        for name, (future, started) in list(self._running.items()):
+            if future.done():
+                del self._running[name]
+                if name in self._timed_out:
+                    self._timed_out.discard(name)
+                else:
+                    self._record_check_future(name, future)
+            elif now - started >= CHECK_TIMEOUT_SECONDS and name not in self._timed_out:
+                # Left to finish, but its late result is not recorded
+                self._timed_out.add(name)
+                logger.error(f"Health check '{name}' timed out")
+                self._record_check_result(name, {
+                    "status": "timeout",
+                    "error": f"No result within {CHECK_TIMEOUT_SECONDS}s"
+                })
+                
+        # Only checks whose cached result is older than their interval are
+        # run; one still running from an earlier round is left to finish
+        for check in self.health_checks:
+            name = check["name"]
+            if name in self._running or self.cached_result(name, check["interval"]) is not None:
+                continue
+            self._running[name] = (HEALTH_CHECK_EXECUTOR.submit(check["func"]), now)
+            
+    def cached_result(self, check_name: str, max_age: float) -> Optional[Dict[str, Any]]:
+        """Latest result of a check if it is at most max_age seconds old"""
+        cached = self._cache.get(check_name)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        return None
+            
+    def _record_check_future(self, name: str, future):
+        """Record the outcome of a finished health check"""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Health check '{name}' failed: {e}")
+            result = {"status": "error", "error": str(e)}
+        self._record_check_result(name, result)
             
     def _check_railway_cli(self) -> Dict[str, Any]:
         """Check Railway CLI status"""
         try:
             # Check authentication
-            result = subprocess.run(
-                ["railway", "whoami"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = _run_railway([self._railway_bin, "whoami"], timeout=10)
             
             if result.returncode == 0:
                 user = result.stdout.strip()
                 
                 # Check project status
-                status_result = subprocess.run(
-                    ["railway", "status"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
+                status_result = _run_railway([self._railway_bin, "status"], timeout=10)
                 
                 return {
                     "status": "healthy",
@@ -194,7 +503,7 @@ class DeploymentMonitor:
             return {"status": "unknown", "error": "No deployment URL found"}
             
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             
             return {
                 "status": "healthy" if response.status_code == 200 else "unhealthy",
@@ -202,7 +511,7 @@ class DeploymentMonitor:
                 "response_time": response.elapsed.total_seconds(),
                 "url": url
             }
-        except requests.RequestException as e:
+        except HTTP_ERRORS as e:
             return {
                 "status": "unhealthy",
                 "error": str(e),
@@ -211,34 +520,11 @@ class DeploymentMonitor:
             
     def _check_api_health(self) -> Dict[str, Any]:
         """Check API endpoints"""
-        base_url = self.deployment_info.get("url") or self.deployment_info.get("app_url")
-        
-        if not base_url:
+        if not self._api_urls:
             return {"status": "unknown", "error": "No deployment URL found"}
             
-        api_endpoints = [
-            "/api/health",
-            "/api/status",
-            "/health",
-            "/api/campaign/create"
-        ]
-        
-        results = []
-        for endpoint in api_endpoints:
-            try:
-                url = f"{base_url.rstrip('/')}{endpoint}"
-                response = requests.get(url, timeout=5)
-                results.append({
-                    "endpoint": endpoint,
-                    "status": response.status_code,
-                    "healthy": response.status_code < 500
-                })
-            except:
-                results.append({
-                    "endpoint": endpoint,
-                    "status": "error",
-                    "healthy": False
-                })
+        # Probe all endpoints at once so one hung endpoint doesn't hold up the rest
+        results = list(PROBE_EXECUTOR.map(self._probe_endpoint, *zip(*self._api_urls)))
                 
         healthy_count = sum(1 for r in results if r["healthy"])
         
@@ -249,23 +535,40 @@ class DeploymentMonitor:
             "details": results
         }
         
+    def _probe_endpoint(self, endpoint: str, url: str) -> Dict[str, Any]:
+        """GET one API endpoint and report whether it answered below 500"""
+        try:
+            response = self._session.get(url, timeout=5)
+            return {
+                "endpoint": endpoint,
+                "status": response.status_code,
+                "healthy": response.status_code < 500
+            }
+        except:
+            return {
+                "endpoint": endpoint,
+                "status": "error",
+                "healthy": False
+            }
+            
     def _check_build_status(self) -> Dict[str, Any]:
         """Check build/deployment status"""
         try:
-            if shutil.which("railway"):
+            if self._railway_bin:
                 # Get recent logs
-                result = subprocess.run(
-                    ["railway", "logs", "--tail", "20"],
-                    capture_output=True,
-                    text=True,
-                    timeout=15
-                )
+                result = _run_railway([self._railway_bin, "logs", "--tail", "20"], timeout=15)
                 
                 logs = result.stdout if result.returncode == 0 else ""
                 
-                # Analyze logs for issues
-                error_keywords = ["error", "failed", "exception", "crash"]
-                errors_found = any(keyword in logs.lower() for keyword in error_keywords)
+                # Analyze logs for issues; lines already seen in the last
+                # sample keep their verdict, so only new lines are scanned
+                verdicts = {}
+                for line in logs.splitlines():
+                    if line not in verdicts:
+                        verdict = self._build_log_verdicts.get(line)
+                        verdicts[line] = self._has_build_error(line) if verdict is None else verdict
+                self._build_log_verdicts = verdicts
+                errors_found = any(verdicts.values())
                 
                 return {
                     "status": "unhealthy" if errors_found else "healthy",
@@ -278,73 +581,107 @@ class DeploymentMonitor:
         except Exception as e:
             return {"status": "error", "error": str(e)}
             
+    @staticmethod
+    def _has_build_error(line: str) -> bool:
+        """Whether a build log line mentions an error"""
+        return BUILD_ERROR_PATTERN.search(line) is not None
+            
     def _log_monitor_loop(self):
         """Monitor deployment logs for issues"""
-        if not shutil.which("railway"):
+        if not self._railway_bin:
             return
             
         while self.monitoring:
             try:
-                # Stream logs
+                # Stream logs; the stream stays open until the process exits
                 process = subprocess.Popen(
-                    ["railway", "logs", "--tail", "10"],
+                    [self._railway_bin, "logs", "--tail", str(LOG_TAIL_LINES)],
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
                 )
+                self._stream_logs(process)
                 
-                for line in process.stdout:
-                    if line:
-                        self._analyze_log_line(line.strip())
-                        
             except Exception as e:
                 logger.error(f"Log monitoring error: {e}")
                 
-            time.sleep(30)  # Restart log streaming every 30 seconds
+            if self.monitoring:
+                time.sleep(30)  # Wait before reconnecting a stream that ended
+                
+    @staticmethod
+    def _read_lines(stream, lines: queue.Queue):
+        """Forward lines from a pipe to a queue, then None once it closes"""
+        try:
+            for raw in iter(stream.readline, b""):
+                lines.put(raw)
+        finally:
+            stream.close()
+            lines.put(None)
+            
+    def _stream_logs(self, process: subprocess.Popen):
+        """Analyze a log stream line by line until it ends or monitoring stops"""
+        # Lines are read on a thread so a quiet stream never blocks the check
+        # of self.monitoring; that also works on Windows, where pipes cannot
+        # be polled with select
+        lines = queue.Queue()
+        threading.Thread(target=self._read_lines, args=(process.stdout, lines), daemon=True).start()
+        replayed = 0
+        
+        try:
+            while self.monitoring:
+                try:
+                    raw = lines.get(timeout=5)
+                except queue.Empty:
+                    continue
+                    
+                if raw is None:
+                    return
+                    
+                line = raw.decode(errors="replace").strip()
+                if not line:
+                    continue
+                # A reconnect replays the last few lines; skip those already seen
+                if replayed < LOG_TAIL_LINES:
+                    replayed += 1
+                    if line in self._recent_log_lines:
+                        continue
+                self._recent_log_lines.append(line)
+                self._analyze_log_line(line)
+        finally:
+            if process.poll() is None:
+                _kill_process_group(process)
+            process.wait()
             
     def _analyze_log_line(self, line: str):
         """Analyze log line for issues"""
-        error_patterns = [
-            ("CRITICAL", r"critical|fatal"),
-            ("ERROR", r"error|exception|failed"),
-            ("WARNING", r"warning|warn"),
-            ("CRASH", r"crash|segfault|terminated")
-        ]
-        
-        for level, pattern in error_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+        # One pass finds every level mentioned; the first in precedence order wins
+        found = {match.lastgroup for match in LOG_LEVEL_PATTERN.finditer(line)}
+        for level, _ in LOG_LEVEL_WORDS:
+            if level in found:
                 self._record_log_event(level, line)
                 break
                 
     def _record_log_event(self, level: str, message: str):
         """Record significant log events"""
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "level": level,
             "message": message[:200]  # Truncate long messages
         }
         
         # Save to event log
-        event_file = "deployment_events.jsonl"
-        with open(event_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        self._events.write(event)
             
         # Alert if critical
         if level in ["CRITICAL", "CRASH"]:
             self._send_alert(f"Critical event detected: {message[:100]}")
             
-    def _metrics_reporter_loop(self):
-        """Report metrics periodically"""
-        while self.monitoring:
-            self._generate_metrics_report()
-            time.sleep(300)  # Report every 5 minutes
-            
     def _generate_metrics_report(self):
         """Generate and save metrics report"""
         uptime = datetime.now() - self.metrics["start_time"]
         
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "uptime_seconds": uptime.total_seconds(),
             "checks_performed": self.metrics["checks_performed"],
             "failures": self.metrics["failures"],
@@ -360,28 +697,10 @@ class DeploymentMonitor:
         logger.info(f"Metrics updated: {self.metrics['checks_performed']} checks, "
                    f"{self.metrics['failures']} failures")
                    
-    def _alert_loop(self):
-        """Check for alert conditions"""
-        consecutive_failures = 0
-        
-        while self.monitoring:
-            current_status = self._get_overall_status()
-            
-            if current_status == "unhealthy":
-                consecutive_failures += 1
-                
-                if consecutive_failures >= 3:
-                    self._send_alert("Deployment unhealthy for 3+ consecutive checks")
-                    consecutive_failures = 0  # Reset to avoid spam
-            else:
-                consecutive_failures = 0
-                
-            time.sleep(60)  # Check every minute
-            
     def _send_alert(self, message: str):
         """Send alert notification"""
         alert = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "message": message,
             "severity": "high"
         }
@@ -390,18 +709,27 @@ class DeploymentMonitor:
         logger.warning(f"ALERT: {message}")
         
         # Save to alerts file
-        with open("deployment_alerts.jsonl", "a") as f:
-            f.write(json.dumps(alert) + "\n")
+        self._alerts.write(alert)
             
         # Could integrate with external alerting services here
         # (Slack, email, PagerDuty, etc.)
         
     def _get_overall_status(self) -> str:
-        """Determine overall deployment status"""
+        """Determine overall deployment status, recomputed only after new results"""
+        with self._status_lock:
+            if self._status_dirty:
+                # Cleared before computing so a result recorded meanwhile
+                # marks the status dirty again
+                self._status_dirty = False
+                self._status_cache = self._compute_overall_status()
+            return self._status_cache
+            
+    def _compute_overall_status(self) -> str:
+        """Overall status from the last 10 check results"""
         if not self.metrics["status_history"]:
             return "unknown"
             
-        recent_statuses = self.metrics["status_history"][-10:]
+        recent_statuses = self._recent_history(10)
         healthy_count = sum(1 for s in recent_statuses if s["status"] == "healthy")
         
         if healthy_count >= 8:
@@ -411,67 +739,98 @@ class DeploymentMonitor:
         else:
             return "unhealthy"
             
+    def _recent_history(self, count: int) -> List[Dict[str, Any]]:
+        """The last count status history entries, newest first"""
+        # list() drains the iterator in one call, so the health check
+        # thread cannot append to the deque partway through
+        return list(islice(reversed(self.metrics["status_history"]), count))
+            
     def _record_check_result(self, check_name: str, result: Dict[str, Any]):
         """Record health check result"""
+        self._cache[check_name] = (time.monotonic(), result)
         self.metrics["checks_performed"] += 1
-        self.metrics["last_check"] = datetime.now().isoformat()
+        timestamp = _timestamp()
+        self.metrics["last_check"] = timestamp
         
         if result.get("status") != "healthy":
             self.metrics["failures"] += 1
             
         # Add to history
         self.metrics["status_history"].append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "check": check_name,
             "status": result.get("status", "unknown")
         })
+        self._status_dirty = True
         
-        # Keep only recent history
-        if len(self.metrics["status_history"]) > 100:
-            self.metrics["status_history"] = self.metrics["status_history"][-100:]
+        # Sample the overall status at most once per round, on the first result
+        # recorded in it, and alert once it has been unhealthy 3 rounds in a row
+        now = time.monotonic()
+        if self._last_alert_round is not None and now - self._last_alert_round < ALERT_ROUND_SECONDS:
+            return
+        self._last_alert_round = now
+        if self._get_overall_status() == "unhealthy":
+            self._consecutive_unhealthy += 1
+            
+            if self._consecutive_unhealthy >= 3:
+                self._send_alert("Deployment unhealthy for 3+ consecutive checks")
+                self._consecutive_unhealthy = 0  # Reset to avoid spam
+        else:
+            self._consecutive_unhealthy = 0
             
     def _display_dashboard(self):
         """Display monitoring dashboard"""
-        os.system('clear' if os.name == 'posix' else 'cls')
-        
-        print("=" * 80)
-        print("ULTRATHINK DEPLOYMENT MONITOR DASHBOARD")
-        print("=" * 80)
-        print(f"Started: {self.metrics['start_time'].strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Uptime: {datetime.now() - self.metrics['start_time']}")
-        print(f"Status: {self._get_overall_status().upper()}")
-        print()
-        
-        print("HEALTH CHECKS:")
-        print("-" * 40)
+        # The frame is built as a list of lines and written at once, after an
+        # ANSI clear-screen, instead of forking `clear` and printing line by line
+        lines = [
+            CLEAR_SCREEN + DASHBOARD_BANNER,
+            f"Started: {self.metrics['start_time'].strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Uptime: {datetime.now() - self.metrics['start_time']}",
+            f"Status: {self._get_overall_status().upper()}",
+            "",
+            "HEALTH CHECKS:",
+            "-" * 40
+        ]
         
         # Display recent check results
         recent_checks = {}
-        for item in reversed(self.metrics["status_history"][-20:]):
+        for item in self._recent_history(20):
             check_name = item["check"]
             if check_name not in recent_checks:
                 recent_checks[check_name] = item
                 
         for check_name, result in recent_checks.items():
             status_icon = "✅" if result["status"] == "healthy" else "❌"
-            print(f"{status_icon} {check_name}: {result['status']}")
+            lines.append(f"{status_icon} {check_name}: {result['status']}")
             
-        print()
-        print("METRICS:")
-        print("-" * 40)
-        print(f"Total Checks: {self.metrics['checks_performed']}")
-        print(f"Failures: {self.metrics['failures']}")
-        print(f"Success Rate: {(1 - self.metrics['failures']/max(self.metrics['checks_performed'], 1)) * 100:.1f}%")
+        lines += [
+            "",
+            "METRICS:",
+            "-" * 40,
+            f"Total Checks: {self.metrics['checks_performed']}",
+            f"Failures: {self.metrics['failures']}",
+            f"Success Rate: {(1 - self.metrics['failures']/max(self.metrics['checks_performed'], 1)) * 100:.1f}%",
+            "",
+            "Press Ctrl+C to stop monitoring"
+        ]
         
-        print()
-        print("Press Ctrl+C to stop monitoring")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
 
 class AutoRecovery:
     """Automated recovery system for deployment issues"""
     
+    # Test for each recovery condition, given the current status
+    _CONDITIONS = {
+        "app_not_responding": lambda status: status.get("app_health", {}).get("status") == "unhealthy",
+        "high_error_rate": lambda status: status.get("error_rate", 0) > 0.5,
+        "config_error": lambda status: "configuration" in str(status.get("last_error", "")).lower()
+    }
+    
     def __init__(self):
         self.recovery_actions = []
+        self._railway_bin = shutil.which("railway")
         self._setup_recovery_actions()
         
     def _setup_recovery_actions(self):
@@ -513,21 +872,16 @@ class AutoRecovery:
         
     def _check_condition(self, condition: str, status: Dict[str, Any]) -> bool:
         """Check if recovery condition is met"""
-        if condition == "app_not_responding":
-            return status.get("app_health", {}).get("status") == "unhealthy"
-        elif condition == "high_error_rate":
-            return status.get("error_rate", 0) > 0.5
-        elif condition == "config_error":
-            return "configuration" in str(status.get("last_error", "")).lower()
-        return False
+        check = self._CONDITIONS.get(condition)
+        return check(status) if check else False
         
     def _restart_deployment(self) -> bool:
         """Attempt to restart deployment"""
         try:
-            if shutil.which("railway"):
+            if self._railway_bin:
                 # Restart via Railway CLI
                 result = subprocess.run(
-                    ["railway", "restart"],
+                    [self._railway_bin, "restart"],
                     capture_output=True,
                     text=True
                 )
@@ -5,21 +5,83 @@ ULTRATHINK RAILWAY API DEPLOYMENT
 Direct Railway API integration for deployment without CLI.
 """
 
+import io
 import os
-import sys
+import hashlib
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-import base64
+import shutil
+import string
 import zipfile
-import tempfile
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # payloads are encoded with the json module
+# Request body listing the account's projects, encoded once at import
+PROJECTS_QUERY_PAYLOAD = b'{"query":"query{me{projects{edges{node{id name createdAt}}}}}"}'
+# me { projects } responses, keyed by a hash of the token they were fetched with
+PROJECTS_CACHE_FILE = Path.home() / ".cache" / "metaads" / "railway_projects.json"
+# Seconds a cached projects list is reused before it is fetched again
+PROJECTS_CACHE_TTL = 300
+# Directory names never packaged from src (dot-directories are skipped as well)
+PACKAGE_IGNORE_DIRS = frozenset({"__pycache__", "node_modules", "coverage", "dist"})
+# Read/write chunk size when copying a file into the package (zipfile uses 8 KiB)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _iter_package_files(root: str):
+    """Yield the files under root, skipping dotfiles and PACKAGE_IGNORE_DIRS"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in PACKAGE_IGNORE_DIRS:
+                    yield from _iter_package_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+
+def _zip_write_file(zf: zipfile.ZipFile, path: str):
+    """Like zf.write(path), but copying in COPY_BUFFER_SIZE chunks"""
+    zinfo = zipfile.ZipInfo.from_file(path)
+    zinfo.compress_type = zf.compression
+    with open(path, "rb") as src, zf.open(zinfo, "w") as dest:
+        shutil.copyfileobj(src, dest, COPY_BUFFER_SIZE)
+
 
 class RailwayAPIDeployer:
     """Deploy directly using Railway API"""
     
+    _SUCCESS_TEMPLATE = string.Template("""
+Deployment package created successfully!
+
+Since direct API deployment requires additional setup, please:
+
+1. Use Railway CLI with your token:
+   export RAILWAY_TOKEN=$token_prefix...
+   railway link $project_id
+   railway up
+
+2. Or use the Railway dashboard:
+   - Go to https://railway.app/project/$project_id
+   - Upload the deployment package
+   - Set environment variables
+
+3. Required environment variables:
+   - OPENAI_API_KEY
+   - NODE_ENV=production
+   - PORT (auto-set by Railway)
+
+Your deployment package is ready for upload!
+""")
+    
     def __init__(self):
         self.api_base = "https://backboard.railway.app/graphql/v2"
         self.token = os.environ.get("RAILWAY_TOKEN")
@@ -29,6 +91,16 @@ class RailwayAPIDeployer:
         if self.token:
             self.headers["Authorization"] = f"Bearer {self.token}"
             
+        # One pooled session so every GraphQL call reuses the same TLS connection
+        self.http = requests.Session()
+        self.http.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.http.mount("https://", adapter)
+            
     def deploy(self) -> Dict[str, Any]:
         """Main deployment method"""
         print("=" * 60)
@@ -119,54 +191,60 @@ fi
             "instructions": "Run ./setup_railway_token.sh to set up token"
         }
         
-    def _graphql_request(self, query: str, variables: Dict = None) -> Dict:
-        """Make GraphQL request to Railway API"""
-        payload = {"query": query}
-        if variables:
-            payload["variables"] = variables
-            
+    def _graphql_request(self, query: Union[str, bytes], variables: Dict = None) -> Dict:
+        """Make GraphQL request to Railway API
+        
+        query may also be a complete, already-encoded request body (bytes).
+        """
+        if isinstance(query, bytes):
+            payload = query
+        else:
+            payload = {"query": query}
+            if variables:
+                payload["variables"] = variables
+        return self._graphql_data(self._graphql_post(payload))
+        
+    def _graphql_post(self, payload: Any) -> Any:
+        """POST a GraphQL payload; returns the decoded JSON body, or None on error
+        
+        payload may also be an already-encoded JSON body (bytes).
+        """
         try:
-            response = requests.post(
-                self.api_base,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            if isinstance(payload, bytes):
+                response = self.http.post(self.api_base, data=payload, timeout=30)
+            elif orjson:
+                response = self.http.post(self.api_base, data=orjson.dumps(payload), timeout=30)
+            else:
+                response = self.http.post(self.api_base, json=payload, timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
-                if "errors" in data:
-                    print(f"GraphQL errors: {data['errors']}")
-                return data.get("data", {})
+                return orjson.loads(response.content) if orjson else response.json()
             else:
                 print(f"API error: {response.status_code} - {response.text}")
-                return {}
+                return None
                 
         except Exception as e:
             print(f"Request error: {e}")
+            return None
+            
+    @staticmethod
+    def _graphql_data(response: Any) -> Dict:
+        """Extract the data of one GraphQL response, printing any errors"""
+        if not isinstance(response, dict):
             return {}
+        if "errors" in response:
+            print(f"GraphQL errors: {response['errors']}")
+        return response.get("data") or {}
             
     def _get_or_create_project(self) -> Optional[Dict]:
         """Get existing project or create new one"""
         # First, try to get existing projects
-        query = """
-        query {
-            me {
-                projects {
-                    edges {
-                        node {
-                            id
-                            name
-                            createdAt
-                        }
-                    }
-                }
-            }
-        }
-        """
-        
-        result = self._graphql_request(query)
-        projects = result.get("me", {}).get("projects", {}).get("edges", [])
+        projects = self._load_cached_projects()
+        if projects is None:
+            result = self._graphql_request(PROJECTS_QUERY_PAYLOAD)
+            projects = result.get("me", {}).get("projects", {}).get("edges", [])
+            if result:
+                self._save_cached_projects(projects)
         
         # Look for existing metaads project
         for project in projects:
@@ -182,6 +260,39 @@ fi
         # For now, return instructions
         return None
         
+    def _projects_cache_key(self) -> str:
+        """Cache key for this token's projects, without storing the token itself"""
+        return hashlib.sha256(self.token.encode()).hexdigest()[:16]
+        
+    def _load_cached_projects(self) -> Optional[List[Dict]]:
+        """Project edges fetched with this token in the last PROJECTS_CACHE_TTL seconds"""
+        try:
+            entry = json.loads(PROJECTS_CACHE_FILE.read_text()).get(self._projects_cache_key())
+        except (OSError, ValueError, AttributeError):
+            return None
+        if entry and time.time() - entry.get("ts", 0) < PROJECTS_CACHE_TTL:
+            return entry.get("data")
+        return None
+        
+    def _save_cached_projects(self, projects: List[Dict]):
+        """Remember this token's project edges; caching is best-effort
+        
+        Anything that creates a project must call this again (or drop the entry)
+        so the new project is not hidden behind a stale list.
+        """
+        try:
+            cache = json.loads(PROJECTS_CACHE_FILE.read_text())
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+        cache[self._projects_cache_key()] = {"ts": time.time(), "data": projects}
+        try:
+            PROJECTS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            PROJECTS_CACHE_FILE.write_text(json.dumps(cache))
+        except OSError:
+            pass
+            
     def _create_service(self, project_id: str) -> Optional[Dict]:
         """Create a service in the project"""
         # Railway service creation via API
@@ -204,64 +315,48 @@ fi
         }
         
     def _create_deployment_package(self) -> str:
-        """Create a deployment package"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        """Create a deployment package
+        
+        The package is uploaded once, so files are stored without compression.
+        """
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         package_name = f"railway_api_deploy_{timestamp}.zip"
         
-        with zipfile.ZipFile(package_name, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # Add all necessary files
-            files_to_include = [
-                "app.py",
-                "requirements.txt",
-                "railway-requirements.txt",
-                "Procfile",
-                "runtime.txt",
-                "package.json",
-                "package-lock.json",
-                "next.config.mjs",
-                "tsconfig.json"
-            ]
+        # Add all necessary files
+        files_to_include = [
+            "app.py",
+            "requirements.txt",
+            "railway-requirements.txt",
+            "Procfile",
+            "runtime.txt",
+            "package.json",
+            "package-lock.json",
+            "next.config.mjs",
+            "tsconfig.json"
+        ]
+        paths = [file for file in files_to_include if Path(file).exists()]
+        
+        # Add directories
+        if os.path.isdir("src"):
+            paths.extend(_iter_package_files("src"))
             
-            for file in files_to_include:
-                if Path(file).exists():
-                    zf.write(file)
-                    
-            # Add directories
-            for root, dirs, files in os.walk("src"):
-                # Skip unwanted directories
-                dirs[:] = [d for d in dirs if d not in ['__pycache__', 'node_modules', '.git']]
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    zf.write(file_path)
-                    
+        # ZipFile seeks back to patch each local header, which would flush a
+        # file buffer every entry; build the archive in memory, write it once
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+            for path in paths:
+                _zip_write_file(zf, path)
+        Path(package_name).write_bytes(buffer.getvalue())
+                        
         print(f"Created deployment package: {package_name}")
         return package_name
         
     def _get_success_instructions(self, project: Dict, service: Dict) -> str:
         """Get success instructions"""
-        return f"""
-Deployment package created successfully!
-
-Since direct API deployment requires additional setup, please:
-
-1. Use Railway CLI with your token:
-   export RAILWAY_TOKEN={self.token[:10]}...
-   railway link {project.get('id', 'PROJECT_ID')}
-   railway up
-
-2. Or use the Railway dashboard:
-   - Go to https://railway.app/project/{project.get('id', 'PROJECT_ID')}
-   - Upload the deployment package
-   - Set environment variables
-
-3. Required environment variables:
-   - OPENAI_API_KEY
-   - NODE_ENV=production
-   - PORT (auto-set by Railway)
-
-Your deployment package is ready for upload!
-"""
+        return self._SUCCESS_TEMPLATE.safe_substitute(
+            token_prefix=self.token[:10],
+            project_id=project.get('id', 'PROJECT_ID')
+        )
 
 
 class RailwayWebhookDeployer:
@@ -9,111 +9,326 @@ import os
 import sys
 import time
 import json
+import sqlite3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # JSON is parsed and written with the json module
+
+# (connect, read) timeouts in seconds: an unreachable host fails fast while a
+# slow response still gets the full read budget
+REQUEST_TIMEOUT = (3, 10)
+# The first probe gives up on connecting even sooner, so a dead deployment is reported quickly
+CONNECTIVITY_TIMEOUT = (2, 10)
+# Fields the /api/health response is expected to carry
+HEALTH_FIELDS = ('status', 'timestamp', 'environment')
+# Campaign created by the campaign API check (and timed by the response time check)
+CAMPAIGN_TEST_PAYLOAD = {
+    "message": "Create a Facebook campaign with $100/day budget for coffee shop",
+    "userId": "test_user"
+}
+# Headers for the JSON POSTs to the campaign API
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Names checks are reported under when they are skipped (the health check always runs)
+SKIPPED_CHECK_NAMES = {
+    'check_api_endpoints': 'Campaign API',
+    'check_cors_headers': 'CORS',
+    'check_response_times': 'Response times',
+    'check_error_handling': 'Error handling'
+}
+# Results of checks that passed, keyed by app URL, build id and check
+VERIFY_CACHE_FILE = Path.home() / ".cache" / "metaads" / "verify.db"
+# Seconds a passing check is trusted for the same build before it is re-run
+VERIFY_CACHE_TTL = 60 * 60
+# Checks whose passing result depends only on the build; connectivity, health and
+# response times measure the live app, so they always run
+CACHEABLE_CHECKS = ('check_api_endpoints', 'check_cors_headers', 'check_error_handling')
+# App URLs reported by the Railway CLI, keyed by the project directory they were looked up in
+RAILWAY_URL_CACHE_FILE = Path.home() / ".cache" / "metaads" / "railway_url.json"
+# Seconds a cached app URL is reused before asking the CLI again
+RAILWAY_URL_CACHE_TTL = 24 * 60 * 60
+
 class DeploymentVerifier:
-    def __init__(self, app_url: Optional[str] = None):
+    def __init__(self, app_url: Optional[str] = None, use_cache: bool = True):
         self.app_url = app_url
+        self.use_cache = use_cache
+        # Build id reported by /api/health; cached results are only reused for the same build
+        self.build_id = None
+        # Set by check_basic_connectivity; False when the app could not be reached at all
+        self.reachable = True
         self.checks_passed = 0
         self.checks_failed = 0
         self.results = []
+        self.started_at = None
+        # Output is shown live on a terminal; piped output is written in one go
+        self._live = sys.stdout.isatty()
+        self._out = []
+        self._lock = threading.Lock()
+        # Per-thread output and results of the check currently running
+        self._local = threading.local()
+        # The one test campaign POST of this run: (response, ms) or the exception it raised
+        self._campaign = None
+        self._campaign_lock = threading.Lock()
+        
+        # Every check hits the same host, so share kept-alive connections
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "deploy-verifier/1"
+        # Railway answers 502/503 for a few seconds after a deploy while the app
+        # cold-starts; retry idempotent requests through that (the POSTs stay
+        # single-shot) and report the last response if it never recovers.
+        # Connect errors and timeouts are not retried: the timeouts already
+        # bound how long an unreachable app may take to fail
+        retry = Retry(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # One host, up to 16 connections to it (the checks and timings peak at 8)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
     def run_verification(self):
         """Run all verification checks"""
-        print("🔍 Railway Deployment Verification")
-        print("=" * 80)
+        self.started_at = datetime.now().isoformat()
+        self._emit("🔍 Railway Deployment Verification")
+        self._emit("=" * 80)
         
         # Get app URL if not provided
         if not self.app_url:
             self.app_url = self.get_railway_url()
             
         if not self.app_url:
-            print("❌ Could not determine Railway app URL")
-            print("Please provide URL: python verify_deployment.py <your-app-url>")
+            self._emit("❌ Could not determine Railway app URL")
+            self._emit("Please provide URL: python verify_deployment.py <your-app-url>")
+            self._flush_output()
             return False
             
-        print(f"🌐 Testing URL: {self.app_url}")
-        print("=" * 80)
+        self._emit(f"🌐 Testing URL: {self.app_url}")
+        self._emit("=" * 80)
         
-        # Run all checks
-        self.check_basic_connectivity()
-        self.check_health_endpoint()
-        self.check_api_endpoints()
-        self.check_cors_headers()
-        self.check_response_times()
-        self.check_error_handling()
+        # Run all checks concurrently; each one's output is shown in order
+        checks = [
+            self.check_basic_connectivity,
+            self.check_health_endpoint,
+            self.check_api_endpoints,
+            self.check_cors_headers,
+            self.check_response_times,
+            self.check_error_handling
+        ]
+        cache = self._open_cache() if self.use_cache else None
+        try:
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = {
+                    check: executor.submit(self._run_check, check)
+                    for check in (self.check_basic_connectivity, self.check_health_endpoint)
+                }
+                # Don't send the remaining checks to an app that can't be reached;
+                # they would only fail the same way
+                futures[self.check_basic_connectivity].result()
+                cached = {}
+                if cache and self.reachable:
+                    # The health check reports the build id the cache is keyed by
+                    futures[self.check_health_endpoint].result()
+                    cached = self._load_cached_checks(
+                        cache, [check.__name__ for check in checks if check.__name__ in CACHEABLE_CHECKS]
+                    )
+                if self.reachable:
+                    for check in checks:
+                        if check not in futures and check.__name__ not in cached:
+                            futures[check] = executor.submit(self._run_check, check)
+                            
+                passed = []
+                for check in checks:
+                    if check not in futures and check.__name__ not in cached:
+                        lines, results = self._skipped(check)
+                    elif check.__name__ in cached:
+                        lines, results = cached[check.__name__]
+                        lines = lines + ["  ♻️  Passed on this build within the last hour (cached)"]
+                        with self._lock:
+                            self.checks_passed += len(results)
+                    else:
+                        lines, results = futures[check].result()
+                        if check.__name__ in CACHEABLE_CHECKS and all(result[0] == '✅' for result in results):
+                            passed.append((check.__name__, lines, results))
+                    self._emit("\n".join(lines))
+                    self.results.extend(results)
+                    
+            if cache:
+                self._store_passed_checks(cache, passed)
+        finally:
+            self.session.close()
+            if cache:
+                cache.close()
         
         # Generate report
         self.generate_report()
         
         return self.checks_failed == 0
         
+    def _skipped(self, check) -> Tuple[List[str], List[Tuple[str, str, str]]]:
+        """Output and result for a check skipped because the app is unreachable"""
+        name = SKIPPED_CHECK_NAMES[check.__name__]
+        return [f"\n⏭️  {name}: skipped, app unreachable"], [('⚠️ ', name, 'skipped: app unreachable')]
+        
+    def _open_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the check result cache; caching is best-effort"""
+        try:
+            VERIFY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(VERIFY_CACHE_FILE)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "url TEXT, build_id TEXT, check_name TEXT, status TEXT, ts REAL, "
+                "lines TEXT, details TEXT, PRIMARY KEY (url, build_id, check_name))"
+            )
+            return db
+        except (OSError, sqlite3.Error):
+            return None
+            
+    def _load_cached_checks(self, db: sqlite3.Connection, names: List[str]) -> Dict:
+        """{check name: (lines, results)} for checks that recently passed on this build"""
+        if not self.build_id:
+            return {}
+        try:
+            rows = db.execute(
+                "SELECT check_name, lines, details FROM results "
+                "WHERE url = ? AND build_id = ? AND status = 'pass' AND ts > ?",
+                (self.app_url, self.build_id, time.time() - VERIFY_CACHE_TTL)
+            ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return {
+            name: (json.loads(lines), [tuple(result) for result in json.loads(details)])
+            for name, lines, details in rows if name in names
+        }
+        
+    def _store_passed_checks(self, db: sqlite3.Connection, passed: List[Tuple[str, List[str], List]]):
+        """Remember the checks that passed on this build"""
+        if not self.build_id:
+            return
+        now = time.time()
+        try:
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, 'pass', ?, ?, ?)",
+                    [
+                        (self.app_url, self.build_id, name, now, json.dumps(lines), json.dumps(results))
+                        for name, lines, results in passed
+                    ]
+                )
+        except sqlite3.Error:
+            pass
+            
     def get_railway_url(self):
-        """Try to get Railway URL from CLI"""
+        """Try to get Railway URL from CLI, reusing the last answer for this project"""
+        project = os.getcwd()
         try:
+            cache = json.loads(RAILWAY_URL_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        entry = cache.get(project) if isinstance(cache, dict) else None
+        if entry and time.time() - entry.get('ts', 0) < RAILWAY_URL_CACHE_TTL:
+            return entry.get('url')
+            
+        url = None
+        try:
+            # Only stdout is parsed; don't let a hung CLI wedge the verifier
             result = subprocess.run(
                 ['railway', 'open', '--json'],
-                capture_output=True,
-                text=True
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=5
             )
             if result.returncode == 0:
-                data = json.loads(result.stdout)
-                return data.get('url')
+                data = orjson.loads(result.stdout) if orjson else json.loads(result.stdout)
+                url = data.get('url')
         except:
             pass
-        return None
+            
+        if url:
+            if not isinstance(cache, dict):
+                cache = {}
+            cache[project] = {'url': url, 'ts': time.time()}
+            try:
+                RAILWAY_URL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                RAILWAY_URL_CACHE_FILE.write_text(json.dumps(cache))
+            except OSError:
+                pass
+        return url
         
-    def check_basic_connectivity(self):
-        """Check basic connectivity to the app"""
-        print("\n1️⃣ Checking Basic Connectivity...")
+    def check_basic_connectivity(self) -> bool:
+        """Check basic connectivity to the app; returns False if it can't be reached at all"""
+        self._print("\n1️⃣ Checking Basic Connectivity...")
         
         try:
-            response = requests.get(self.app_url, timeout=10)
+            # The body is only downloaded if it is JSON worth parsing
+            with self.session.get(self.app_url, timeout=CONNECTIVITY_TIMEOUT, stream=True) as response:
+                data = None
+                if response.status_code == 200 and 'json' in response.headers.get('Content-Type', ''):
+                    try:
+                        data = self._json(response)
+                    except ValueError:
+                        pass
+                        
             if response.status_code == 200:
                 self.record_success("Basic connectivity", "App is reachable")
-                print("  ✅ App is reachable")
+                self._print("  ✅ App is reachable")
                 
                 # Check response content
-                try:
-                    data = response.json()
-                    if 'status' in data and data['status'] == 'healthy':
-                        self.record_success("Health status", "App reports healthy")
-                        print("  ✅ App reports healthy status")
-                except:
+                if data is None:
                     self.record_warning("Response format", "Not JSON or missing status")
+                elif isinstance(data, dict) and data.get('status') == 'healthy':
+                    self.record_success("Health status", "App reports healthy")
+                    self._print("  ✅ App reports healthy status")
                     
             else:
                 self.record_failure("Basic connectivity", f"Status code: {response.status_code}")
-                print(f"  ❌ Unexpected status code: {response.status_code}")
+                self._print(f"  ❌ Unexpected status code: {response.status_code}")
                 
-        except requests.exceptions.Timeout:
-            self.record_failure("Basic connectivity", "Request timed out")
-            print("  ❌ Request timed out")
-        except requests.exceptions.ConnectionError:
-            self.record_failure("Basic connectivity", "Connection failed")
-            print("  ❌ Connection failed - app may not be running")
         except Exception as e:
-            self.record_failure("Basic connectivity", str(e))
-            print(f"  ❌ Error: {e}")
+            if isinstance(e, requests.exceptions.Timeout):
+                details, message = "Request timed out", "Request timed out"
+                self.reachable = not isinstance(e, requests.exceptions.ConnectTimeout)
+            elif isinstance(e, requests.exceptions.ConnectionError):
+                details, message = "Connection failed", "Connection failed - app may not be running"
+                self.reachable = False
+            else:
+                details, message = str(e), f"Error: {e}"
+            self.record_failure("Basic connectivity", details)
+            self._print(f"  ❌ {message}")
             
+        return self.reachable
+        
     def check_health_endpoint(self):
         """Check health endpoint"""
-        print("\n2️⃣ Checking Health Endpoint...")
+        self._print("\n2️⃣ Checking Health Endpoint...")
         
         try:
-            response = requests.get(f"{self.app_url}/api/health", timeout=10)
+            response = self.session.get(f"{self.app_url}/api/health", timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 
                 # Check expected fields
-                expected_fields = ['status', 'timestamp', 'environment']
-                for field in expected_fields:
+                for field in HEALTH_FIELDS:
                     if field in data:
-                        print(f"  ✅ {field}: {data[field]}")
+                        self._print(f"  ✅ {field}: {data[field]}")
                     else:
                         self.record_warning("Health endpoint", f"Missing field: {field}")
                         
@@ -122,72 +337,63 @@ class DeploymentVerifier:
                 # Check environment details
                 if 'environment' in data:
                     env = data['environment']
-                    print(f"  📊 Python version: {env.get('python_version', 'unknown')}")
-                    print(f"  🔑 OpenAI key configured: {env.get('has_openai_key', False)}")
-                    print(f"  🌍 Railway region: {env.get('railway_region', 'unknown')}")
+                    self.build_id = env.get('build_id')
+                    self._print(f"  📊 Python version: {env.get('python_version', 'unknown')}")
+                    self._print(f"  🔑 OpenAI key configured: {env.get('has_openai_key', False)}")
+                    self._print(f"  🌍 Railway region: {env.get('railway_region', 'unknown')}")
                     
             else:
                 self.record_failure("Health endpoint", f"Status code: {response.status_code}")
                 
         except Exception as e:
             self.record_failure("Health endpoint", str(e))
-            print(f"  ❌ Error: {e}")
+            self._print(f"  ❌ Error: {e}")
             
     def check_api_endpoints(self):
         """Check API endpoints"""
-        print("\n3️⃣ Checking API Endpoints...")
+        self._print("\n3️⃣ Checking API Endpoints...")
         
         # Test campaign creation endpoint
-        test_payload = {
-            "message": "Create a Facebook campaign with $100/day budget for coffee shop",
-            "userId": "test_user"
-        }
-        
         try:
-            response = requests.post(
-                f"{self.app_url}/api/campaign/create",
-                json=test_payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
+            response, _ = self._create_test_campaign()
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 
                 if data.get('success'):
                     self.record_success("Campaign API", "Campaign created successfully")
-                    print("  ✅ Campaign creation API working")
+                    self._print("  ✅ Campaign creation API working")
                     
                     # Check response structure
                     if 'campaign' in data:
                         campaign = data['campaign']
-                        print(f"  📋 Campaign ID: {campaign.get('id')}")
-                        print(f"  💰 Budget: {campaign.get('budget')}")
-                        print(f"  🎯 Platform: {campaign.get('platform')}")
+                        self._print(f"  📋 Campaign ID: {campaign.get('id')}")
+                        self._print(f"  💰 Budget: {campaign.get('budget')}")
+                        self._print(f"  🎯 Platform: {campaign.get('platform')}")
                 else:
                     self.record_failure("Campaign API", "API returned success=false")
                     
             else:
                 self.record_failure("Campaign API", f"Status code: {response.status_code}")
-                print(f"  ❌ Status code: {response.status_code}")
+                self._print(f"  ❌ Status code: {response.status_code}")
                 
         except Exception as e:
             self.record_failure("Campaign API", str(e))
-            print(f"  ❌ Error: {e}")
+            self._print(f"  ❌ Error: {e}")
             
     def check_cors_headers(self):
         """Check CORS headers"""
-        print("\n4️⃣ Checking CORS Configuration...")
+        self._print("\n4️⃣ Checking CORS Configuration...")
         
         # Test OPTIONS request
         try:
-            response = requests.options(
+            response = self.session.options(
                 f"{self.app_url}/api/campaign/create",
                 headers={
                     "Origin": "https://metaads.vercel.app",
                     "Access-Control-Request-Method": "POST"
                 },
-                timeout=10
+                timeout=REQUEST_TIMEOUT
             )
             
             cors_headers = {
@@ -199,21 +405,21 @@ class DeploymentVerifier:
             # Check if CORS is properly configured
             if cors_headers['Access-Control-Allow-Origin']:
                 self.record_success("CORS", "Headers present")
-                print("  ✅ CORS headers configured")
+                self._print("  ✅ CORS headers configured")
                 for header, value in cors_headers.items():
                     if value:
-                        print(f"  📋 {header}: {value}")
+                        self._print(f"  📋 {header}: {value}")
             else:
                 self.record_failure("CORS", "Missing CORS headers")
-                print("  ❌ CORS headers missing")
+                self._print("  ❌ CORS headers missing")
                 
         except Exception as e:
             self.record_failure("CORS", str(e))
-            print(f"  ❌ Error checking CORS: {e}")
+            self._print(f"  ❌ Error checking CORS: {e}")
             
     def check_response_times(self):
         """Check response times"""
-        print("\n5️⃣ Checking Response Times...")
+        self._print("\n5️⃣ Checking Response Times...")
         
         endpoints = [
             ('/', 'Home'),
@@ -221,125 +427,212 @@ class DeploymentVerifier:
             ('/api/campaign/create', 'Campaign API')
         ]
         
-        for endpoint, name in endpoints:
-            try:
-                start = time.time()
+        # Time the endpoints concurrently; results are reported in order
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            timings = list(executor.map(self._time_endpoint, [endpoint for endpoint, _ in endpoints]))
+            
+        for (endpoint, name), elapsed in zip(endpoints, timings):
+            if elapsed is None:
+                self.record_failure(f"{name} response time", "Failed to measure")
+                self._print(f"  ❌ {name}: Failed to measure")
+            elif elapsed < 500:
+                self.record_success(f"{name} response time", f"{elapsed:.0f}ms")
+                self._print(f"  ✅ {name}: {elapsed:.0f}ms (Good)")
+            elif elapsed < 1000:
+                self.record_warning(f"{name} response time", f"{elapsed:.0f}ms")
+                self._print(f"  ⚠️  {name}: {elapsed:.0f}ms (Slow)")
+            else:
+                self.record_failure(f"{name} response time", f"{elapsed:.0f}ms")
+                self._print(f"  ❌ {name}: {elapsed:.0f}ms (Too slow)")
                 
-                if endpoint == '/api/campaign/create':
-                    response = requests.post(
-                        f"{self.app_url}{endpoint}",
-                        json={"message": "test", "userId": "test"},
-                        timeout=10
-                    )
-                else:
-                    response = requests.get(f"{self.app_url}{endpoint}", timeout=10)
-                    
-                elapsed = (time.time() - start) * 1000  # Convert to ms
+    def _time_endpoint(self, endpoint: str) -> Optional[float]:
+        """Time to the response headers of one request to endpoint in ms, or None if it failed
+        
+        The body is never read, so a large page doesn't count against the app.
+        """
+        try:
+            if endpoint == '/api/campaign/create':
+                # Reuse the campaign API check's request rather than creating another campaign
+                return self._create_test_campaign()[1]
                 
-                if elapsed < 500:
-                    self.record_success(f"{name} response time", f"{elapsed:.0f}ms")
-                    print(f"  ✅ {name}: {elapsed:.0f}ms (Good)")
-                elif elapsed < 1000:
-                    self.record_warning(f"{name} response time", f"{elapsed:.0f}ms")
-                    print(f"  ⚠️  {name}: {elapsed:.0f}ms (Slow)")
-                else:
-                    self.record_failure(f"{name} response time", f"{elapsed:.0f}ms")
-                    print(f"  ❌ {name}: {elapsed:.0f}ms (Too slow)")
+            start = time.perf_counter()
+            response = self.session.get(f"{self.app_url}{endpoint}", timeout=REQUEST_TIMEOUT, stream=True)
+            elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
+            response.close()
+            return elapsed
+            
+        except Exception:
+            return None
+            
+    def _create_test_campaign(self) -> Tuple[requests.Response, float]:
+        """POST the test campaign once per run, returning (response, ms to headers)
+        
+        Both the campaign API check and the response time check use this
+        request; whichever runs first sends it and the other waits for it.
+        """
+        with self._campaign_lock:
+            if self._campaign is None:
+                try:
+                    start = time.perf_counter()
+                    response = self.session.post(
+                        f"{self.app_url}/api/campaign/create",
+                        json=CAMPAIGN_TEST_PAYLOAD,
+                        headers=JSON_HEADERS,
+                        timeout=REQUEST_TIMEOUT,
+                        stream=True
+                    )
+                    elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
+                    response.content  # Read the body for the campaign API check
+                    self._campaign = (response, elapsed)
+                except Exception as e:
+                    self._campaign = e
                     
-            except Exception as e:
-                self.record_failure(f"{name} response time", "Failed to measure")
-                print(f"  ❌ {name}: Failed to measure")
-                
+        if isinstance(self._campaign, Exception):
+            raise self._campaign
+        return self._campaign
+        
     def check_error_handling(self):
         """Check error handling"""
-        print("\n6️⃣ Checking Error Handling...")
+        self._print("\n6️⃣ Checking Error Handling...")
         
         # Test with invalid payload
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.app_url}/api/campaign/create",
                 json={},  # Empty payload
-                timeout=10
+                timeout=REQUEST_TIMEOUT
             )
             
             if response.status_code == 400:
                 self.record_success("Error handling", "Properly rejects invalid input")
-                print("  ✅ Properly handles invalid input (400)")
+                self._print("  ✅ Properly handles invalid input (400)")
             else:
                 self.record_warning("Error handling", f"Unexpected status: {response.status_code}")
-                print(f"  ⚠️  Unexpected status for invalid input: {response.status_code}")
+                self._print(f"  ⚠️  Unexpected status for invalid input: {response.status_code}")
                 
         except Exception as e:
             self.record_failure("Error handling", str(e))
-            print(f"  ❌ Error: {e}")
+            self._print(f"  ❌ Error: {e}")
             
         # Test 404 handling
         try:
-            response = requests.get(f"{self.app_url}/nonexistent", timeout=10)
+            # Only the status matters, so skip downloading the 404 page
+            url = f"{self.app_url}/nonexistent"
+            response = self.session.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+            if response.status_code == 405:
+                with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                    pass
             if response.status_code == 404:
                 self.record_success("404 handling", "Properly handles missing routes")
-                print("  ✅ Properly handles 404")
+                self._print("  ✅ Properly handles 404")
             else:
                 self.record_warning("404 handling", f"Unexpected status: {response.status_code}")
                 
         except Exception as e:
             self.record_failure("404 handling", str(e))
             
+    def _run_check(self, check) -> Tuple[List[str], List[Tuple[str, str, str]]]:
+        """Run one check, returning the lines it printed and the results it recorded"""
+        self._local.lines = []
+        self._local.results = []
+        check()
+        return self._local.lines, self._local.results
+        
+    @staticmethod
+    def _json(response: requests.Response):
+        """Decode a response body as JSON"""
+        return orjson.loads(response.content) if orjson else response.json()
+        
+    def _emit(self, text: str = ""):
+        """Print progress output, or hold it for _flush_output when not on a terminal"""
+        if self._live:
+            print(text)
+        else:
+            self._out.append(text)
+            
+    def _flush_output(self):
+        """Write the held output with a single write"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            sys.stdout.flush()
+            self._out.clear()
+            
+    def _print(self, line: str = ""):
+        """Print from a check; shown once the check and those before it finish"""
+        self._local.lines.append(line)
+        
     def record_success(self, check: str, details: str):
         """Record successful check"""
-        self.checks_passed += 1
-        self.results.append(('✅', check, details))
+        with self._lock:
+            self.checks_passed += 1
+        self._local.results.append(('✅', check, details))
         
     def record_failure(self, check: str, details: str):
         """Record failed check"""
-        self.checks_failed += 1
-        self.results.append(('❌', check, details))
+        with self._lock:
+            self.checks_failed += 1
+        self._local.results.append(('❌', check, details))
         
     def record_warning(self, check: str, details: str):
         """Record warning"""
-        self.results.append(('⚠️ ', check, details))
+        self._local.results.append(('⚠️ ', check, details))
         
     def generate_report(self):
         """Generate verification report"""
-        print("\n" + "=" * 80)
-        print("📊 VERIFICATION REPORT")
-        print("=" * 80)
+        self._emit("\n" + "=" * 80)
+        self._emit("📊 VERIFICATION REPORT")
+        self._emit("=" * 80)
         
-        print(f"\n✅ Passed: {self.checks_passed}")
-        print(f"❌ Failed: {self.checks_failed}")
+        self._emit(f"\n✅ Passed: {self.checks_passed}")
+        self._emit(f"❌ Failed: {self.checks_failed}")
         
         if self.checks_failed == 0:
-            print("\n🎉 DEPLOYMENT VERIFIED SUCCESSFULLY!")
-            print("Your Railway app is running correctly.")
+            self._emit("\n🎉 DEPLOYMENT VERIFIED SUCCESSFULLY!")
+            self._emit("Your Railway app is running correctly.")
         else:
-            print("\n⚠️  DEPLOYMENT HAS ISSUES!")
-            print("Please check the failed items above.")
+            self._emit("\n⚠️  DEPLOYMENT HAS ISSUES!")
+            self._emit("Please check the failed items above.")
             
         # Save detailed report
         report_data = {
             'url': self.app_url,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self.started_at,
             'passed': self.checks_passed,
             'failed': self.checks_failed,
             'results': self.results
         }
         
-        with open('deployment_verification_report.json', 'w') as f:
-            json.dump(report_data, f, indent=2)
+        if orjson:
+            with open('deployment_verification_report.json', 'wb') as f:
+                f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open('deployment_verification_report.json', 'w') as f:
+                json.dump(report_data, f, indent=2)
             
-        print(f"\n📄 Detailed report saved to: deployment_verification_report.json")
+        self._emit(f"\n📄 Detailed report saved to: deployment_verification_report.json")
+        self._flush_output()
 
 
 def main():
     """Main entry point"""
-    if len(sys.argv) > 1:
-        app_url = sys.argv[1]
+    args = sys.argv[1:]
+    use_cache = '--no-cache' not in args
+    if not use_cache:
+        # Re-run every check instead of trusting recent passes on the same build
+        args.remove('--no-cache')
+    if '--refresh' in args:
+        # Forget cached app URLs so the Railway CLI is asked again
+        args.remove('--refresh')
+        RAILWAY_URL_CACHE_FILE.unlink(missing_ok=True)
+        
+    if args:
+        app_url = args[0]
         if not app_url.startswith('http'):
             app_url = f"https://{app_url}"
     else:
         app_url = None
         
-    verifier = DeploymentVerifier(app_url)
+    verifier = DeploymentVerifier(app_url, use_cache=use_cache)
     success = verifier.run_verification()
     
     sys.exit(0 if success else 1)